@@ -1,7 +1,3 @@
-import time
-import json
-
-
 def create_neutral_debator(llm):
     def neutral_node(state) -> dict:
         risk_debate_state = state["risk_debate_state"]
@@ -4,9 +4,100 @@ Uses BM25 (Best Matching 25) algorithm for retrieval - no API calls,
 no token limits, works offline with any LLM provider.
 """
 
-from rank_bm25 import BM25Okapi
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+import heapq
 import re
+import sys
+
+import numpy as np
+
+# Word tokens for BM25: runs of alphanumerics/underscore
+_TOKEN_RE = re.compile(r"\b\w+\b")
+
+# Max distinct (situation, n_matches) queries cached per memory instance
+_QUERY_CACHE_SIZE = 128
+
+# Okapi BM25 parameters shared by every memory instance
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_EPSILON = 0.25
+
+
+def tokenize(text: str, _findall=_TOKEN_RE.findall) -> List[str]:
+    """Tokenize text for BM25 indexing.
+
+    Simple whitespace + punctuation tokenization with case folding.
+    """
+    # Case-fold and split on non-alphanumeric characters
+    return _findall(text.casefold())
+
+
+class _BM25Index:
+    """Okapi BM25 over an inverted index, scored with NumPy.
+
+    Produces the same scores as ``rank_bm25.BM25Okapi`` (including its epsilon
+    floor for negative IDFs), but each query term only touches the documents
+    that contain it instead of looping over every document in Python.
+
+    Terms are mapped to integer ids through ``vocab``; the postings for term
+    ``t`` are ``doc_ids[indptr[t]:indptr[t + 1]]`` with matching term
+    frequencies in ``tf`` (CSR layout). Scores are only used for ranking and
+    max-normalisation, so all score inputs are stored as float32.
+    """
+
+    def __init__(
+        self,
+        corpus: List[List[str]],
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+        epsilon: float = BM25_EPSILON,
+    ):
+        self.k1 = k1
+        self.corpus_size = len(corpus)
+
+        doc_len = np.array([len(doc) for doc in corpus], dtype=np.float32)
+        avgdl = doc_len.sum() / self.corpus_size
+        # Per-document length normalisation term of the BM25 denominator
+        if avgdl:
+            self.doc_norm = (k1 * (1 - b + b * doc_len / avgdl)).astype(np.float32)
+        else:
+            self.doc_norm = np.full(self.corpus_size, k1 * (1 - b), dtype=np.float32)
+
+        # (term id, doc id, term frequency) triples, one per distinct term per doc
+        self.vocab: Dict[str, int] = {}
+        term_parts, doc_parts, tf_parts = [], [], []
+        for doc_id, tokens in enumerate(corpus):
+            ids = np.array([self.vocab.setdefault(t, len(self.vocab)) for t in tokens], dtype=np.int32)
+            terms, counts = np.unique(ids, return_counts=True)
+            term_parts.append(terms)
+            doc_parts.append(np.full(len(terms), doc_id, dtype=np.int32))
+            tf_parts.append(counts)
+
+        terms = np.concatenate(term_parts)
+        order = np.argsort(terms, kind="stable")
+        self.doc_ids = np.concatenate(doc_parts)[order]
+        self.tf = np.concatenate(tf_parts)[order].astype(np.float32)
+        df = np.bincount(terms, minlength=len(self.vocab))
+        self.indptr = np.concatenate(([0], np.cumsum(df)))
+
+        self.idf = (np.log(self.corpus_size - df + 0.5) - np.log(df + 0.5)).astype(np.float32)
+        if len(self.idf):
+            self.idf[self.idf < 0] = epsilon * self.idf.mean()
+
+    def get_scores(self, query_tokens: List[str]) -> np.ndarray:
+        """Return the BM25 score of every document for ``query_tokens``."""
+        scores = np.zeros(self.corpus_size, dtype=np.float32)
+        k1_plus_1 = np.float32(self.k1 + 1)
+        for term in query_tokens:
+            term_id = self.vocab.get(term)
+            if term_id is None:
+                continue
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            doc_ids = self.doc_ids[start:end]
+            tf = self.tf[start:end]
+            scores[doc_ids] += self.idf[term_id] * (tf * k1_plus_1 / (tf + self.doc_norm[doc_ids]))
+        return scores
 
 
 class FinancialSituationMemory:
@@ -22,37 +113,58 @@ class FinancialSituationMemory:
         self.name = name
         self.documents: List[str] = []
         self.recommendations: List[str] = []
+        # Token lists parallel to self.documents, so each document is tokenized once
+        self._tokenized_docs: List[List[str]] = []
+        # Situation text -> index in self.documents, so repeats update in place
+        self._doc_index: Dict[str, int] = {}
         self.bm25 = None
+        # LRU of get_memories results; emptied whenever the corpus changes
+        self._query_cache: "OrderedDict[Tuple[str, int], List[dict]]" = OrderedDict()
 
     def _tokenize(self, text: str) -> List[str]:
-        """Tokenize text for BM25 indexing.
+        """Tokenize text for BM25 indexing; see the module-level ``tokenize``.
 
-        Simple whitespace + punctuation tokenization with lowercasing.
+        Stored situations go through this once, in add_situations; afterwards
+        only the (short) query text is folded and split.
         """
-        # Lowercase and split on non-alphanumeric characters
-        tokens = re.findall(r'\b\w+\b', text.lower())
-        return tokens
+        return tokenize(text)
 
     def _rebuild_index(self):
         """Rebuild the BM25 index after adding documents."""
-        if self.documents:
-            tokenized_docs = [self._tokenize(doc) for doc in self.documents]
-            self.bm25 = BM25Okapi(tokenized_docs)
+        self._query_cache.clear()
+        if self._tokenized_docs:
+            self.bm25 = _BM25Index(self._tokenized_docs)
         else:
             self.bm25 = None
 
     def add_situations(self, situations_and_advice: List[Tuple[str, str]]):
         """Add financial situations and their corresponding advice.
 
+        A situation that is already stored keeps its slot and only has its
+        recommendation replaced with the newer one.
+
         Args:
             situations_and_advice: List of tuples (situation, recommendation)
         """
+        added = False
         for situation, recommendation in situations_and_advice:
+            idx = self._doc_index.get(situation)
+            if idx is not None:
+                self.recommendations[idx] = recommendation
+                continue
+            situation = sys.intern(situation)
+            self._doc_index[situation] = len(self.documents)
             self.documents.append(situation)
             self.recommendations.append(recommendation)
+            self._tokenized_docs.append(self._tokenize(situation))
+            added = True
 
-        # Rebuild BM25 index with new documents
-        self._rebuild_index()
+        if added:
+            # Rebuild BM25 index with new documents
+            self._rebuild_index()
+        else:
+            # Same index, but cached results may carry stale recommendations
+            self._query_cache.clear()
 
     def get_memories(self, current_situation: str, n_matches: int = 1) -> List[dict]:
         """Find matching recommendations using BM25 similarity.
@@ -67,35 +179,53 @@ class FinancialSituationMemory:
         if not self.documents or self.bm25 is None:
             return []
 
-        # Tokenize query
-        query_tokens = self._tokenize(current_situation)
+        key = (current_situation, n_matches)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return [dict(result) for result in cached]
+
+        # Tokenize query, keeping only terms the index knows about
+        vocab = self.bm25.vocab
+        query_tokens = [t for t in self._tokenize(current_situation) if t in vocab]
+        if not query_tokens:
+            # Nothing in common with any stored situation: every score is zero
+            return []
 
         # Get BM25 scores for all documents
         scores = self.bm25.get_scores(query_tokens)
 
-        # Get top-n indices sorted by score (descending)
-        top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n_matches]
+        # Get top-n indices sorted by score (descending) without a full sort
+        top_indices = heapq.nlargest(n_matches, range(len(scores)), key=scores.__getitem__)
+
+        # Normalize the selected scores to 0-1 range in one vectorized step
+        max_score = float(scores.max())
+        if max_score <= 0:
+            max_score = 1
+        normalized_scores = (scores[top_indices] * (1.0 / max_score)).tolist()
 
         # Build results
         results = []
-        max_score = max(scores) if max(scores) > 0 else 1  # Normalize scores
-
-        for idx in top_indices:
-            # Normalize score to 0-1 range for consistency
-            normalized_score = scores[idx] / max_score if max_score > 0 else 0
+        for idx, normalized_score in zip(top_indices, normalized_scores):
             results.append({
                 "matched_situation": self.documents[idx],
                 "recommendation": self.recommendations[idx],
                 "similarity_score": normalized_score,
             })
 
-        return results
+        self._query_cache[key] = results
+        if len(self._query_cache) > _QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return [dict(result) for result in results]
 
     def clear(self):
         """Clear all stored memories."""
         self.documents = []
         self.recommendations = []
+        self._tokenized_docs = []
+        self._doc_index = {}
         self.bm25 = None
+        self._query_cache.clear()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import alphanexus.default_config as default_config
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
@@ -20,8 +21,15 @@ def set_config(config: Dict):
     _config.update(config)
 
 
-def get_config() -> Dict:
-    """Get the current configuration."""
+def get_config() -> Mapping:
+    """Get a read-only view of the current configuration (no copy)."""
+    if _config is None:
+        initialize_config()
+    return MappingProxyType(_config)
+
+
+def get_config_copy() -> Dict:
+    """Get a private, mutable copy of the current configuration."""
     if _config is None:
         initialize_config()
     return _config.copy()
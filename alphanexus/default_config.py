@@ -22,6 +22,9 @@ DEFAULT_CONFIG = {
     "min_risk_discuss_rounds": 2,
     "max_risk_discuss_rounds": 3,
     "max_recur_limit": 100,
+    # Run the selected analysts concurrently instead of in sequence. Their
+    # tool-call messages then don't appear in the streamed graph state.
+    "parallel_analysts": False,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
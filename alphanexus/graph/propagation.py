@@ -7,6 +7,17 @@ from alphanexus.agents.utils.agent_states import (
     RiskDebateState,
 )
 
+# Skeletons for the debate sub-states. Calling a TypedDict builds a fresh
+# dict from its argument, so each initial state gets its own copy.
+_INVEST_DEBATE_INIT = {"history": "", "current_response": "", "count": 0}
+_RISK_DEBATE_INIT = {
+    "history": "",
+    "current_aggressive_response": "",
+    "current_conservative_response": "",
+    "current_neutral_response": "",
+    "count": 0,
+}
+
 
 class Propagator:
     """Handles state initialization and propagation through the graph."""
@@ -24,18 +35,8 @@ class Propagator:
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
             "risk_profile": risk_profile,
-            "investment_debate_state": InvestDebateState(
-                {"history": "", "current_response": "", "count": 0}
-            ),
-            "risk_debate_state": RiskDebateState(
-                {
-                    "history": "",
-                    "current_aggressive_response": "",
-                    "current_conservative_response": "",
-                    "current_neutral_response": "",
-                    "count": 0,
-                }
-            ),
+            "investment_debate_state": InvestDebateState(_INVEST_DEBATE_INIT),
+            "risk_debate_state": RiskDebateState(_RISK_DEBATE_INIT),
             "market_report": "",
             "fundamentals_report": "",
             "sentiment_report": "",
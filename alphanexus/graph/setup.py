@@ -1,6 +1,7 @@
 # AlphaNexus/graph/setup.py
 
 from typing import Dict, Any
+from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -10,6 +11,15 @@ from alphanexus.agents.utils.agent_states import AgentState
 
 from .conditional_logic import ConditionalLogic
 
+# State fields each analyst produces; a parallel analyst branch hands only
+# these back to the main graph.
+ANALYST_OUTPUT_KEYS = {
+    "market": ("market_report",),
+    "social": ("sentiment_report",),
+    "news": ("news_report", "news_report_ui"),
+    "fundamentals": ("fundamentals_report",),
+}
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -37,8 +47,43 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
 
+    def _create_analyst_branch(self, analyst_type, analyst_node, delete_node, tool_node):
+        """Compile one analyst's tool-calling loop as a standalone subgraph.
+
+        The subgraph keeps its own message list, so several analysts can run
+        side by side without interleaving tool calls; the returned node only
+        reports the analyst's output fields back to the main graph.
+        """
+        name = analyst_type.capitalize()
+        analyst = f"{name} Analyst"
+        tools = f"tools_{analyst_type}"
+        clear = f"Msg Clear {name}"
+
+        branch = StateGraph(AgentState)
+        branch.add_node(analyst, analyst_node)
+        branch.add_node(tools, tool_node)
+        branch.add_node(clear, delete_node)
+        branch.add_edge(START, analyst)
+        branch.add_conditional_edges(
+            analyst,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            [tools, clear],
+        )
+        branch.add_edge(tools, analyst)
+        branch.add_edge(clear, END)
+        branch = branch.compile()
+        output_keys = ANALYST_OUTPUT_KEYS[analyst_type]
+
+        def run_branch(state, config: RunnableConfig):
+            result = branch.invoke(state, config)
+            return {key: result[key] for key in output_keys if key in result}
+
+        return run_branch
+
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts: bool = False,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +93,10 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the selected analysts concurrently,
+                each in its own subgraph, instead of one after another. Their
+                intermediate tool-call messages then stay out of the main
+                graph's state.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -110,6 +159,17 @@ class GraphSetup:
 
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
+            if parallel_analysts:
+                workflow.add_node(
+                    f"{analyst_type.capitalize()} Analyst",
+                    self._create_analyst_branch(
+                        analyst_type,
+                        node,
+                        delete_nodes[analyst_type],
+                        tool_nodes[analyst_type],
+                    ),
+                )
+                continue
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
             workflow.add_node(
                 f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
@@ -127,30 +187,40 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
-
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+        if parallel_analysts:
+            # Fan out to every analyst; Bull Researcher waits for all of them
+            analyst_names = [
+                f"{analyst_type.capitalize()} Analyst"
+                for analyst_type in selected_analysts
+            ]
+            for analyst_name in analyst_names:
+                workflow.add_edge(START, analyst_name)
+            workflow.add_edge(analyst_names, "Bull Researcher")
+        else:
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
+
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
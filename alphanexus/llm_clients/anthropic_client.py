@@ -1,10 +1,17 @@
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 from langchain_anthropic import ChatAnthropic
 
-from .base_client import BaseLLMClient
+from .base_client import BaseLLMClient, get_cached_llm
 from .validators import validate_model
 
+# Option keys forwarded to ChatAnthropic, excluding per-run callbacks
+_LLM_OPTION_KEYS = ("timeout", "max_retries", "api_key", "max_tokens")
+
+# ChatAnthropic instances shared across clients with identical configuration
+_LLM_CACHE: "OrderedDict[Tuple, ChatAnthropic]" = OrderedDict()
+
 
 class AnthropicClient(BaseLLMClient):
     """Client for Anthropic Claude models."""
@@ -13,14 +20,23 @@ class AnthropicClient(BaseLLMClient):
         super().__init__(model, base_url, **kwargs)
 
     def get_llm(self) -> Any:
-        """Return configured ChatAnthropic instance."""
+        """Return configured ChatAnthropic instance.
+
+        Instances without callbacks are shared per configuration; callbacks are
+        bound per run, so an LLM that carries them is always built fresh.
+        """
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "api_key", "max_tokens", "callbacks"):
+        for key in _LLM_OPTION_KEYS:
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
-        return ChatAnthropic(**llm_kwargs)
+        if "callbacks" in self.kwargs:
+            return ChatAnthropic(callbacks=self.kwargs["callbacks"], **llm_kwargs)
+
+        return get_cached_llm(
+            _LLM_CACHE, tuple(llm_kwargs.items()), lambda: ChatAnthropic(**llm_kwargs)
+        )
 
     def validate_model(self) -> bool:
         """Validate model for Anthropic."""
@@ -1,5 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+# Max LLM instances each client module keeps; keys include API keys, so bound it
+LLM_CACHE_SIZE = 64
+
+# Guards the LLM caches; graphs for concurrent web requests are built in threads
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_llm(cache: "OrderedDict[Tuple, Any]", key: Tuple, build: Callable[[], Any]) -> Any:
+    """Return the LLM cached under ``key``, building it with ``build`` on a miss.
+
+    LangChain chat models hold no per-run state, so clients with the same
+    configuration can share one instance (and its HTTP connection pool).
+    Keys that aren't hashable just skip the cache.
+    """
+    try:
+        hash(key)
+    except TypeError:
+        return build()
+    with _LLM_CACHE_LOCK:
+        llm = cache.get(key)
+        if llm is not None:
+            cache.move_to_end(key)
+            return llm
+    llm = build()
+    with _LLM_CACHE_LOCK:
+        cache[key] = llm
+        if len(cache) > LLM_CACHE_SIZE:
+            cache.popitem(last=False)
+    return llm
 
 
 class BaseLLMClient(ABC):
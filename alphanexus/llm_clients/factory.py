@@ -1,9 +1,20 @@
-from typing import Optional
+from importlib import import_module
+from typing import Dict, Optional, Tuple
 
 from .base_client import BaseLLMClient
-from .openai_client import OpenAIClient
-from .anthropic_client import AnthropicClient
-from .google_client import GoogleClient
+
+# Lowercased provider name -> (client module, client class, extra constructor
+# kwargs). Client modules are imported on first use so that picking one
+# provider doesn't load the LangChain integrations of all the others.
+_PROVIDERS: Dict[str, Tuple[str, str, Dict[str, str]]] = {
+    "openai": (".openai_client", "OpenAIClient", {"provider": "openai"}),
+    "ollama": (".openai_client", "OpenAIClient", {"provider": "ollama"}),
+    "openrouter": (".openai_client", "OpenAIClient", {"provider": "openrouter"}),
+    "deepseek": (".openai_client", "OpenAIClient", {"provider": "deepseek"}),
+    "xai": (".openai_client", "OpenAIClient", {"provider": "xai"}),
+    "anthropic": (".anthropic_client", "AnthropicClient", {}),
+    "google": (".google_client", "GoogleClient", {}),
+}
 
 
 def create_llm_client(
@@ -26,18 +37,9 @@ def create_llm_client(
     Raises:
         ValueError: If provider is not supported
     """
-    provider_lower = provider.lower()
-
-    if provider_lower in ("openai", "ollama", "openrouter", "deepseek"):
-        return OpenAIClient(model, base_url, provider=provider_lower, **kwargs)
-
-    if provider_lower == "xai":
-        return OpenAIClient(model, base_url, provider="xai", **kwargs)
-
-    if provider_lower == "anthropic":
-        return AnthropicClient(model, base_url, **kwargs)
-
-    if provider_lower == "google":
-        return GoogleClient(model, base_url, **kwargs)
-
-    raise ValueError(f"Unsupported LLM provider: {provider}")
+    entry = _PROVIDERS.get(provider.lower())
+    if entry is None:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+    module_name, class_name, extra_kwargs = entry
+    client_cls = getattr(import_module(module_name, __package__), class_name)
+    return client_cls(model, base_url, **extra_kwargs, **kwargs)
@@ -1,10 +1,17 @@
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from .base_client import BaseLLMClient
+from .base_client import BaseLLMClient, get_cached_llm
 from .validators import validate_model
 
+# Option keys forwarded to ChatGoogleGenerativeAI, excluding per-run callbacks
+_LLM_OPTION_KEYS = ("timeout", "max_retries", "google_api_key", "transport")
+
+# NormalizedChatGoogleGenerativeAI instances shared across clients with identical configuration
+_LLM_CACHE: "OrderedDict[Tuple, Any]" = OrderedDict()
+
 
 class NormalizedChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
     """ChatGoogleGenerativeAI with normalized content output.
@@ -15,13 +22,20 @@ class NormalizedChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
 
     def _normalize_content(self, response):
         content = response.content
+        if isinstance(content, str):
+            # Already plain text (Gemini <= 2.5); nothing to normalize
+            return response
         if isinstance(content, list):
-            texts = [
-                item.get("text", "") if isinstance(item, dict) and item.get("type") == "text"
-                else item if isinstance(item, str) else ""
-                for item in content
-            ]
-            response.content = "\n".join(t for t in texts if t)
+            response.content = "\n".join(
+                text
+                for text in (
+                    item if isinstance(item, str)
+                    else item.get("text", "") if isinstance(item, dict) and item.get("type") == "text"
+                    else ""
+                    for item in content
+                )
+                if text
+            )
         return response
 
     def invoke(self, input, config=None, **kwargs):
@@ -35,10 +49,14 @@ class GoogleClient(BaseLLMClient):
         super().__init__(model, base_url, **kwargs)
 
     def get_llm(self) -> Any:
-        """Return configured ChatGoogleGenerativeAI instance."""
+        """Return configured ChatGoogleGenerativeAI instance.
+
+        Instances without callbacks are shared per configuration; callbacks are
+        bound per run, so an LLM that carries them is always built fresh.
+        """
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "google_api_key", "callbacks", "transport"):
+        for key in _LLM_OPTION_KEYS:
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
@@ -62,7 +80,16 @@ class GoogleClient(BaseLLMClient):
                 # Gemini 2.5: map to thinking_budget
                 llm_kwargs["thinking_budget"] = -1 if thinking_level == "high" else 0
 
-        return NormalizedChatGoogleGenerativeAI(**llm_kwargs)
+        if "callbacks" in self.kwargs:
+            return NormalizedChatGoogleGenerativeAI(
+                callbacks=self.kwargs["callbacks"], **llm_kwargs
+            )
+
+        return get_cached_llm(
+            _LLM_CACHE,
+            tuple(llm_kwargs.items()),
+            lambda: NormalizedChatGoogleGenerativeAI(**llm_kwargs),
+        )
 
     def validate_model(self) -> bool:
         """Validate model for Google."""
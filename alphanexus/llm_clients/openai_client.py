@@ -1,11 +1,28 @@
 import os
-from typing import Any, Optional
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 from langchain_openai import ChatOpenAI
 
-from .base_client import BaseLLMClient
+from .base_client import BaseLLMClient, get_cached_llm
 from .validators import validate_model
 
+# Option keys forwarded to ChatOpenAI, excluding per-run callbacks
+_LLM_OPTION_KEYS = ("timeout", "max_retries", "reasoning_effort", "api_key")
+
+# UnifiedChatOpenAI instances shared across clients with identical configuration
+_LLM_CACHE: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+# o1/o3-prefixed and GPT-5 family models reject temperature/top_p
+_REASONING_MODEL_RE = re.compile(r"^(?:o1|o3)|gpt-5", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _is_reasoning(model: str) -> bool:
+    return _REASONING_MODEL_RE.search(model) is not None
+
 
 class UnifiedChatOpenAI(ChatOpenAI):
     """ChatOpenAI subclass that strips incompatible params for certain models."""
@@ -20,12 +37,7 @@ class UnifiedChatOpenAI(ChatOpenAI):
     @staticmethod
     def _is_reasoning_model(model: str) -> bool:
         """Check if model is a reasoning model that doesn't support temperature."""
-        model_lower = model.lower()
-        return (
-            model_lower.startswith("o1")
-            or model_lower.startswith("o3")
-            or "gpt-5" in model_lower
-        )
+        return _is_reasoning(model)
 
 
 class OpenAIClient(BaseLLMClient):
@@ -42,7 +54,11 @@ class OpenAIClient(BaseLLMClient):
         self.provider = provider.lower()
 
     def get_llm(self) -> Any:
-        """Return configured ChatOpenAI instance."""
+        """Return configured ChatOpenAI instance.
+
+        Instances without callbacks are shared per configuration; callbacks are
+        bound per run, so an LLM that carries them is always built fresh.
+        """
         llm_kwargs = {"model": self.model}
 
         if self.provider == "xai":
@@ -66,11 +82,16 @@ class OpenAIClient(BaseLLMClient):
         elif self.base_url:
             llm_kwargs["base_url"] = self.base_url
 
-        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks"):
+        for key in _LLM_OPTION_KEYS:
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
-        return UnifiedChatOpenAI(**llm_kwargs)
+        if "callbacks" in self.kwargs:
+            return UnifiedChatOpenAI(callbacks=self.kwargs["callbacks"], **llm_kwargs)
+
+        return get_cached_llm(
+            _LLM_CACHE, tuple(llm_kwargs.items()), lambda: UnifiedChatOpenAI(**llm_kwargs)
+        )
 
     def validate_model(self) -> bool:
         """Validate model for the provider."""
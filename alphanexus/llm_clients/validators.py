@@ -4,8 +4,10 @@ Only validates model names - does NOT enforce limits.
 Let LLM providers use their own defaults for unspecified params.
 """
 
+from functools import lru_cache
+
 VALID_MODELS = {
-    "openai": [
+    "openai": frozenset({
         # GPT-5 series (2025)
         "gpt-5.2",
         "gpt-5.1",
@@ -25,8 +27,8 @@ VALID_MODELS = {
         # GPT-4o series (legacy but still supported)
         "gpt-4o",
         "gpt-4o-mini",
-    ],
-    "anthropic": [
+    }),
+    "anthropic": frozenset({
         # Claude 4.5 series (2025)
         "claude-opus-4-5",
         "claude-sonnet-4-5",
@@ -39,8 +41,8 @@ VALID_MODELS = {
         # Claude 3.5 series (legacy)
         "claude-3-5-haiku-20241022",
         "claude-3-5-sonnet-20241022",
-    ],
-    "google": [
+    }),
+    "google": frozenset({
         # Gemini 3.1 series
         "gemini-3.1-pro-preview",
         # Gemini 3 series (preview)
@@ -53,8 +55,8 @@ VALID_MODELS = {
         # Gemini 2.0 series
         "gemini-2.0-flash",
         "gemini-2.0-flash-lite",
-    ],
-    "xai": [
+    }),
+    "xai": frozenset({
         # Grok 4.1 series
         "grok-4-1-fast",
         "grok-4-1-fast-reasoning",
@@ -64,14 +66,15 @@ VALID_MODELS = {
         "grok-4-0709",
         "grok-4-fast-reasoning",
         "grok-4-fast-non-reasoning",
-    ],
-    "deepseek": [
+    }),
+    "deepseek": frozenset({
         "deepseek-chat",
         "deepseek-reasoner",
-    ],
+    }),
 }
 
 
+@lru_cache(maxsize=256)
 def validate_model(provider: str, model: str) -> bool:
     """Check if model name is valid for the given provider.
 
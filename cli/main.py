@@ -1,4 +1,5 @@
 from typing import Optional
+import ast
 import datetime
 import typer
 from pathlib import Path
@@ -17,12 +18,19 @@ from rich.layout import Layout
 from rich.text import Text
 from rich.table import Table
 from collections import deque
+from heapq import merge
+from itertools import islice
+from operator import itemgetter
+import queue
+import threading
 import time
 from rich.tree import Tree
 from rich import box
 from rich.align import Align
 from rich.rule import Rule
 
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
 from alphanexus.graph.trading_graph import AlphaNexusGraph
 from alphanexus.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
@@ -32,6 +40,9 @@ from cli.stats_handler import StatsCallbackHandler
 
 console = Console()
 
+# Static ASCII art banner, resolved relative to this module rather than the CWD
+WELCOME_ASCII = (Path(__file__).parent / "static" / "welcome.txt").read_text(encoding="utf-8")
+
 app = typer.Typer(
     name="AlphaNexus",
     help="AlphaNexus CLI: Multi-Agents LLM Financial Trading Framework",
@@ -70,6 +81,14 @@ class MessageBuffer:
         "final_trade_decision": (None, "Portfolio Manager"),
     }
 
+    # Analyst report sections in display order, with their final-report titles
+    ANALYST_REPORT_TITLES = (
+        ("market_report", "Market Analysis"),
+        ("sentiment_report", "Social Sentiment"),
+        ("news_report", "News Analysis"),
+        ("fundamentals_report", "Fundamentals Analysis"),
+    )
+
     def __init__(self, max_length=100):
         self.messages = deque(maxlen=max_length)
         self.tool_calls = deque(maxlen=max_length)
@@ -80,6 +99,15 @@ class MessageBuffer:
         self.report_sections = {}
         self.selected_analysts = []
         self._last_message_id = None
+        # Bumped by every mutator so the renderer can tell when state changed
+        self._rev = 0
+        # Hash of the last report body written to disk, per section
+        self._report_hashes = {}
+        # Analysts whose report has been received; skipped by later sweeps
+        self._completed_analysts = set()
+        self._ordered_analysts = ()
+        # Last raw debate history seen per state key, to skip unchanged ones
+        self._last_debate = {}
 
     def init_for_analysis(self, selected_analysts):
         """Initialize agent status and report sections based on selected analysts.
@@ -88,25 +116,34 @@ class MessageBuffer:
             selected_analysts: List of analyst type strings (e.g., ["market", "news"])
         """
         self.selected_analysts = [a.lower() for a in selected_analysts]
+        # (analyst_key, agent_name, report_key) for selected analysts, in run order
+        selected_set = set(self.selected_analysts)
+        self._ordered_analysts = tuple(
+            (key, ANALYST_AGENT_NAMES[key], ANALYST_REPORT_MAP[key])
+            for key in ANALYST_ORDER
+            if key in selected_set
+        )
 
-        # Build agent_status dynamically
-        self.agent_status = {}
-
-        # Add selected analysts
-        for analyst_key in self.selected_analysts:
-            if analyst_key in self.ANALYST_MAPPING:
-                self.agent_status[self.ANALYST_MAPPING[analyst_key]] = "pending"
-
-        # Add fixed teams
-        for team_agents in self.FIXED_AGENTS.values():
-            for agent in team_agents:
-                self.agent_status[agent] = "pending"
+        # Build agent_status dynamically: selected analysts first, then fixed teams
+        selected_names = [
+            self.ANALYST_MAPPING[key]
+            for key in self.selected_analysts
+            if key in self.ANALYST_MAPPING
+        ]
+        fixed_names = [
+            agent for team_agents in self.FIXED_AGENTS.values() for agent in team_agents
+        ]
+        self.agent_status = dict.fromkeys(selected_names + fixed_names, "pending")
 
         # Build report_sections dynamically
-        self.report_sections = {}
-        for section, (analyst_key, _) in self.REPORT_SECTIONS.items():
-            if analyst_key is None or analyst_key in self.selected_analysts:
-                self.report_sections[section] = None
+        self.report_sections = dict.fromkeys(
+            (
+                section
+                for section, (analyst_key, _) in self.REPORT_SECTIONS.items()
+                if analyst_key is None or analyst_key in self.selected_analysts
+            ),
+            None,
+        )
 
         # Reset other state
         self.current_report = None
@@ -115,6 +152,10 @@ class MessageBuffer:
         self.messages.clear()
         self.tool_calls.clear()
         self._last_message_id = None
+        self._report_hashes.clear()
+        self._completed_analysts.clear()
+        self._last_debate.clear()
+        self._rev += 1
 
     def get_completed_reports_count(self):
         """Count reports that are finalized (their finalizing agent is completed).
@@ -139,21 +180,42 @@ class MessageBuffer:
 
     def add_message(self, message_type, content):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.messages.append((timestamp, message_type, content))
+        # Content is immutable once logged, so clip it for display here
+        self.messages.append((timestamp, message_type, _truncate_content(content)))
+        self._rev += 1
 
     def add_tool_call(self, tool_name, args):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.tool_calls.append((timestamp, tool_name, args))
+        # args never change once logged, so format the display line up front
+        display = f"{tool_name}: {format_tool_args(args)}"
+        self.tool_calls.append((timestamp, tool_name, args, display))
+        self._rev += 1
+
+    def changed_history(self, key, raw):
+        """Return the stripped debate history for ``key`` if it changed since
+        the previous chunk, otherwise an empty string.
+        """
+        if self._last_debate.get(key) == raw:
+            return ""
+        self._last_debate[key] = raw
+        return raw.strip()
 
     def update_agent_status(self, agent, status):
         if agent in self.agent_status:
             self.agent_status[agent] = status
             self.current_agent = agent
+            self._rev += 1
+
+    def bulk_set_status(self, status):
+        """Set every tracked agent to ``status`` in one update."""
+        self.agent_status = dict.fromkeys(self.agent_status, status)
+        self._rev += 1
 
     def update_report_section(self, section_name, content):
         if section_name in self.report_sections:
             self.report_sections[section_name] = content
             self._update_current_report()
+            self._rev += 1
 
     def _update_current_report(self):
         # For the panel display, only show the most recently updated section
@@ -186,42 +248,36 @@ class MessageBuffer:
 
     def _update_final_report(self):
         report_parts = []
+        sections = self.report_sections
 
         # Analyst Team Reports - use .get() to handle missing sections
-        analyst_sections = ["market_report", "sentiment_report", "news_report", "fundamentals_report"]
-        if any(self.report_sections.get(section) for section in analyst_sections):
-            report_parts.append("## Analyst Team Reports")
-            if self.report_sections.get("market_report"):
-                report_parts.append(
-                    f"### Market Analysis\n{self.report_sections['market_report']}"
-                )
-            if self.report_sections.get("sentiment_report"):
-                report_parts.append(
-                    f"### Social Sentiment\n{self.report_sections['sentiment_report']}"
-                )
-            if self.report_sections.get("news_report"):
-                report_parts.append(
-                    f"### News Analysis\n{self.report_sections['news_report']}"
-                )
-            if self.report_sections.get("fundamentals_report"):
-                report_parts.append(
-                    f"### Fundamentals Analysis\n{self.report_sections['fundamentals_report']}"
-                )
+        analyst_parts = [
+            f"### {title}\n{sections[section]}"
+            for section, title in self.ANALYST_REPORT_TITLES
+            if sections.get(section)
+        ]
+        if analyst_parts:
+            report_parts.append(
+                "## Analyst Team Reports\n\n" + "\n\n".join(analyst_parts)
+            )
 
         # Research Team Reports
-        if self.report_sections.get("investment_plan"):
-            report_parts.append("## Research Team Decision")
-            report_parts.append(f"{self.report_sections['investment_plan']}")
+        if sections.get("investment_plan"):
+            report_parts.append(
+                f"## Research Team Decision\n\n{sections['investment_plan']}"
+            )
 
         # Trading Team Reports
-        if self.report_sections.get("trader_investment_plan"):
-            report_parts.append("## Trading Team Plan")
-            report_parts.append(f"{self.report_sections['trader_investment_plan']}")
+        if sections.get("trader_investment_plan"):
+            report_parts.append(
+                f"## Trading Team Plan\n\n{sections['trader_investment_plan']}"
+            )
 
         # Portfolio Management Decision
-        if self.report_sections.get("final_trade_decision"):
-            report_parts.append("## Portfolio Management Decision")
-            report_parts.append(f"{self.report_sections['final_trade_decision']}")
+        if sections.get("final_trade_decision"):
+            report_parts.append(
+                f"## Portfolio Management Decision\n\n{sections['final_trade_decision']}"
+            )
 
         self.final_report = "\n\n".join(report_parts) if report_parts else None
 
@@ -242,9 +298,28 @@ def create_layout():
     layout["upper"].split_row(
         Layout(name="progress", ratio=2), Layout(name="messages", ratio=3)
     )
+    # Header with welcome message (static, so it is set once here)
+    layout["header"].update(
+        Panel(
+            "[bold green]Welcome to AlphaNexus CLI[/bold green]\n"
+            "[dim]© [Tauric Research](https://github.com/TauricResearch)[/dim]",
+            title="Welcome to AlphaNexus",
+            border_style="green",
+            padding=(1, 2),
+            expand=True,
+        )
+    )
     return layout
 
 
+def _truncate_content(content, max_length=200):
+    """Stringify message content and clip it for the messages panel."""
+    content_str = str(content) if content else ""
+    if len(content_str) > max_length:
+        return content_str[:max_length - 3] + "..."
+    return content_str
+
+
 def format_tokens(n):
     """Format token count for display."""
     if n >= 1000:
@@ -252,18 +327,20 @@ def format_tokens(n):
     return str(n)
 
 
+# Minimum seconds between redraws when the message buffer has not changed
+DISPLAY_MIN_INTERVAL = 0.25
+
+
 def update_display(layout, spinner_text=None, stats_handler=None, start_time=None):
-    # Header with welcome message
-    layout["header"].update(
-        Panel(
-            "[bold green]Welcome to AlphaNexus CLI[/bold green]\n"
-            "[dim]© [Tauric Research](https://github.com/TauricResearch)[/dim]",
-            title="Welcome to AlphaNexus",
-            border_style="green",
-            padding=(1, 2),
-            expand=True,
-        )
-    )
+    # Skip the rebuild if nothing changed and we drew very recently
+    now = time.time()
+    if (
+        message_buffer._rev == update_display._last_rev
+        and now - update_display._last_draw < DISPLAY_MIN_INTERVAL
+    ):
+        return
+    update_display._last_rev = message_buffer._rev
+    update_display._last_draw = now
 
     # Progress panel showing agent status
     progress_table = Table(
@@ -358,29 +435,22 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
         "Content", style="white", no_wrap=False, ratio=1
     )  # Make content column expand
 
-    # Combine tool calls and messages
-    all_messages = []
-
-    # Add tool calls
-    for timestamp, tool_name, args in message_buffer.tool_calls:
-        formatted_args = format_tool_args(args)
-        all_messages.append((timestamp, "Tool", f"{tool_name}: {formatted_args}"))
-
-    # Add regular messages
-    for timestamp, msg_type, content in message_buffer.messages:
-        content_str = str(content) if content else ""
-        if len(content_str) > 200:
-            content_str = content_str[:197] + "..."
-        all_messages.append((timestamp, msg_type, content_str))
-
-    # Sort by timestamp descending (newest first)
-    all_messages.sort(key=lambda x: x[0], reverse=True)
+    # Both deques are appended in time order, so walk them newest-first and
+    # merge lazily instead of materializing and sorting every buffered entry
+    tool_stream = (
+        (timestamp, "Tool", display)
+        for timestamp, _, _, display in reversed(message_buffer.tool_calls)
+    )
+    message_stream = reversed(message_buffer.messages)
 
     # Calculate how many messages we can show based on available space
     max_messages = 12
 
     # Get the first N messages (newest ones)
-    recent_messages = all_messages[:max_messages]
+    recent_messages = islice(
+        merge(tool_stream, message_stream, key=itemgetter(0), reverse=True),
+        max_messages,
+    )
 
     # Add messages to table (already in newest-first order)
     for timestamp, msg_type, content in recent_messages:
@@ -428,12 +498,27 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
     reports_completed = message_buffer.get_completed_reports_count()
     reports_total = len(message_buffer.report_sections)
 
+    stats = stats_handler.get_stats() if stats_handler else None
+    elapsed = int(time.time() - start_time) if start_time else None
+
+    # Only rebuild the footer when a displayed figure actually changed
+    footer_key = (
+        agents_completed,
+        agents_total,
+        reports_completed,
+        reports_total,
+        tuple(stats.values()) if stats else None,
+        elapsed,
+    )
+    if footer_key == update_display._last_footer_key:
+        return
+    update_display._last_footer_key = footer_key
+
     # Build stats parts
     stats_parts = [f"Agents: {agents_completed}/{agents_total}"]
 
     # LLM and tool stats from callback handler
-    if stats_handler:
-        stats = stats_handler.get_stats()
+    if stats:
         stats_parts.append(f"LLM: {stats['llm_calls']}")
         stats_parts.append(f"Tools: {stats['tool_calls']}")
 
@@ -447,9 +532,8 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
     stats_parts.append(f"Reports: {reports_completed}/{reports_total}")
 
     # Elapsed time
-    if start_time:
-        elapsed = time.time() - start_time
-        elapsed_str = f"\u23f1 {int(elapsed // 60):02d}:{int(elapsed % 60):02d}"
+    if elapsed is not None:
+        elapsed_str = f"\u23f1 {elapsed // 60:02d}:{elapsed % 60:02d}"
         stats_parts.append(elapsed_str)
 
     stats_table = Table(show_header=False, box=None, padding=(0, 2), expand=True)
@@ -459,14 +543,15 @@ def update_display(layout, spinner_text=None, stats_handler=None, start_time=Non
     layout["footer"].update(Panel(stats_table, border_style="grey50"))
 
 
+update_display._last_rev = None
+update_display._last_draw = 0.0
+update_display._last_footer_key = None
+
+
 def get_user_selections():
     """Get all user selections before starting the analysis display."""
-    # Display ASCII art welcome message
-    with open("./cli/static/welcome.txt", "r") as f:
-        welcome_ascii = f.read()
-
     # Create welcome box content
-    welcome_content = f"{welcome_ascii}\n"
+    welcome_content = f"{WELCOME_ASCII}\n"
     welcome_content += "[bold green]AlphaNexus: Multi-Agents LLM Financial Trading Framework - CLI[/bold green]\n\n"
     welcome_content += "[bold]Workflow Steps:[/bold]\n"
     welcome_content += "I. Analyst Team → II. Research Team → III. Trader → IV. Risk Management → V. Portfolio Management\n\n"
@@ -613,6 +698,11 @@ def get_analysis_date():
             )
 
 
+def _write_markdown(path: Path, text: str):
+    """Write a markdown artifact as UTF-8 bytes, without newline translation."""
+    path.write_bytes(text.encode("utf-8"))
+
+
 def save_report_to_disk(final_state, ticker: str, save_path: Path):
     """Save complete analysis report to disk with organized subfolders."""
     save_path.mkdir(parents=True, exist_ok=True)
@@ -623,19 +713,19 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
     analyst_parts = []
     if final_state.get("market_report"):
         analysts_dir.mkdir(exist_ok=True)
-        (analysts_dir / "market.md").write_text(final_state["market_report"])
+        _write_markdown(analysts_dir / "market.md", final_state["market_report"])
         analyst_parts.append(("Market Analyst", final_state["market_report"]))
     if final_state.get("sentiment_report"):
         analysts_dir.mkdir(exist_ok=True)
-        (analysts_dir / "sentiment.md").write_text(final_state["sentiment_report"])
+        _write_markdown(analysts_dir / "sentiment.md", final_state["sentiment_report"])
         analyst_parts.append(("Social Analyst", final_state["sentiment_report"]))
     if final_state.get("news_report"):
         analysts_dir.mkdir(exist_ok=True)
-        (analysts_dir / "news.md").write_text(final_state["news_report"])
+        _write_markdown(analysts_dir / "news.md", final_state["news_report"])
         analyst_parts.append(("News Analyst", final_state["news_report"]))
     if final_state.get("fundamentals_report"):
         analysts_dir.mkdir(exist_ok=True)
-        (analysts_dir / "fundamentals.md").write_text(final_state["fundamentals_report"])
+        _write_markdown(analysts_dir / "fundamentals.md", final_state["fundamentals_report"])
         analyst_parts.append(("Fundamentals Analyst", final_state["fundamentals_report"]))
     if analyst_parts:
         content = "\n\n".join(f"### {name}\n{text}" for name, text in analyst_parts)
@@ -648,15 +738,15 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
         research_parts = []
         if debate.get("bull_history"):
             research_dir.mkdir(exist_ok=True)
-            (research_dir / "bull.md").write_text(debate["bull_history"])
+            _write_markdown(research_dir / "bull.md", debate["bull_history"])
             research_parts.append(("Bull Researcher", debate["bull_history"]))
         if debate.get("bear_history"):
             research_dir.mkdir(exist_ok=True)
-            (research_dir / "bear.md").write_text(debate["bear_history"])
+            _write_markdown(research_dir / "bear.md", debate["bear_history"])
             research_parts.append(("Bear Researcher", debate["bear_history"]))
         if debate.get("judge_decision"):
             research_dir.mkdir(exist_ok=True)
-            (research_dir / "manager.md").write_text(debate["judge_decision"])
+            _write_markdown(research_dir / "manager.md", debate["judge_decision"])
             research_parts.append(("Research Manager", debate["judge_decision"]))
         if research_parts:
             content = "\n\n".join(f"### {name}\n{text}" for name, text in research_parts)
@@ -666,7 +756,7 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
     if final_state.get("trader_investment_plan"):
         trading_dir = save_path / "3_trading"
         trading_dir.mkdir(exist_ok=True)
-        (trading_dir / "trader.md").write_text(final_state["trader_investment_plan"])
+        _write_markdown(trading_dir / "trader.md", final_state["trader_investment_plan"])
         sections.append(f"## III. Trading Team Plan\n\n### Trader\n{final_state['trader_investment_plan']}")
 
     # 4. Risk Management
@@ -676,15 +766,15 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
         risk_parts = []
         if risk.get("aggressive_history"):
             risk_dir.mkdir(exist_ok=True)
-            (risk_dir / "aggressive.md").write_text(risk["aggressive_history"])
+            _write_markdown(risk_dir / "aggressive.md", risk["aggressive_history"])
             risk_parts.append(("Aggressive Analyst", risk["aggressive_history"]))
         if risk.get("conservative_history"):
             risk_dir.mkdir(exist_ok=True)
-            (risk_dir / "conservative.md").write_text(risk["conservative_history"])
+            _write_markdown(risk_dir / "conservative.md", risk["conservative_history"])
             risk_parts.append(("Conservative Analyst", risk["conservative_history"]))
         if risk.get("neutral_history"):
             risk_dir.mkdir(exist_ok=True)
-            (risk_dir / "neutral.md").write_text(risk["neutral_history"])
+            _write_markdown(risk_dir / "neutral.md", risk["neutral_history"])
             risk_parts.append(("Neutral Analyst", risk["neutral_history"]))
         if risk_parts:
             content = "\n\n".join(f"### {name}\n{text}" for name, text in risk_parts)
@@ -694,12 +784,12 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
         if risk.get("judge_decision"):
             portfolio_dir = save_path / "5_portfolio"
             portfolio_dir.mkdir(exist_ok=True)
-            (portfolio_dir / "decision.md").write_text(risk["judge_decision"])
+            _write_markdown(portfolio_dir / "decision.md", risk["judge_decision"])
             sections.append(f"## V. Portfolio Manager Decision\n\n### Portfolio Manager\n{risk['judge_decision']}")
 
     # Write consolidated report
     header = f"# Trading Analysis Report: {ticker}\n\nGenerated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    (save_path / "complete_report.md").write_text(header + "\n\n".join(sections))
+    _write_markdown(save_path / "complete_report.md", header + "\n\n".join(sections))
     return save_path / "complete_report.md"
 
 
@@ -797,19 +887,19 @@ def update_analyst_statuses(message_buffer, chunk):
     - When all analysts done, set Bull Researcher to in_progress
     """
     selected = message_buffer.selected_analysts
+    completed = message_buffer._completed_analysts
     found_active = False
 
-    for analyst_key in ANALYST_ORDER:
-        if analyst_key not in selected:
+    for analyst_key, agent_name, report_key in message_buffer._ordered_analysts:
+        if analyst_key in completed:
             continue
 
-        agent_name = ANALYST_AGENT_NAMES[analyst_key]
-        report_key = ANALYST_REPORT_MAP[analyst_key]
         has_report = bool(chunk.get(report_key))
 
         if has_report:
             message_buffer.update_agent_status(agent_name, "completed")
             message_buffer.update_report_section(report_key, chunk[report_key])
+            completed.add(analyst_key)
         elif not found_active:
             message_buffer.update_agent_status(agent_name, "in_progress")
             found_active = True
@@ -821,12 +911,14 @@ def update_analyst_statuses(message_buffer, chunk):
         if message_buffer.agent_status.get("Bull Researcher") == "pending":
             message_buffer.update_agent_status("Bull Researcher", "in_progress")
 
+# First characters a Python literal can start with; anything else is plain text
+_LITERAL_START_CHARS = frozenset("[{('\"-0123456789tTfFnN")
+
+
 def extract_content_string(content):
     """Extract string content from various message formats.
     Returns None if no meaningful text content is found.
     """
-    import ast
-
     def is_empty(val):
         """Check if value is empty using Python's truthiness."""
         if val is None or val == '':
@@ -835,6 +927,8 @@ def extract_content_string(content):
             s = val.strip()
             if not s:
                 return True
+            if s[0] not in _LITERAL_START_CHARS:
+                return False  # Can't be a literal = real text
             try:
                 return not bool(ast.literal_eval(s))
             except (ValueError, SyntaxError):
@@ -852,17 +946,35 @@ def extract_content_string(content):
         return text.strip() if not is_empty(text) else None
 
     if isinstance(content, list):
-        text_parts = [
-            item.get('text', '').strip() if isinstance(item, dict) and item.get('type') == 'text'
-            else (item.strip() if isinstance(item, str) else '')
-            for item in content
-        ]
-        result = ' '.join(t for t in text_parts if t and not is_empty(t))
+        def text_part(item):
+            if isinstance(item, dict) and item.get('type') == 'text':
+                return item.get('text', '').strip()
+            return item.strip() if isinstance(item, str) else ''
+
+        result = ' '.join(
+            t for t in map(text_part, content) if t and not is_empty(t)
+        )
         return result if result else None
 
     return str(content).strip() if not is_empty(content) else None
 
 
+# Display type per LangChain message class. Subclasses (e.g. AIMessageChunk)
+# are resolved through their MRO on first sight and cached here.
+_MESSAGE_KINDS = {HumanMessage: "User", ToolMessage: "Data", AIMessage: "Agent"}
+
+
+def _message_kind(message_cls) -> str:
+    kind = _MESSAGE_KINDS.get(message_cls)
+    if kind is None:
+        kind = next(
+            (_MESSAGE_KINDS[base] for base in message_cls.__mro__ if base in _MESSAGE_KINDS),
+            "System",  # Fallback for unknown types
+        )
+        _MESSAGE_KINDS[message_cls] = kind
+    return kind
+
+
 def classify_message_type(message) -> tuple[str, str | None]:
     """Classify LangChain message into display type and extract content.
 
@@ -870,32 +982,133 @@ def classify_message_type(message) -> tuple[str, str | None]:
         (type, content) - type is one of: User, Agent, Data, Control
                         - content is extracted string or None
     """
-    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
-
     content = extract_content_string(getattr(message, 'content', None))
+    kind = _message_kind(type(message))
 
-    if isinstance(message, HumanMessage):
-        if content and content.strip() == "Continue":
-            return ("Control", content)
-        return ("User", content)
-
-    if isinstance(message, ToolMessage):
-        return ("Data", content)
-
-    if isinstance(message, AIMessage):
-        return ("Agent", content)
-
-    # Fallback for unknown types
-    return ("System", content)
+    if kind == "User" and content and content.strip() == "Continue":
+        return ("Control", content)
+    return (kind, content)
 
 
 def format_tool_args(args, max_length=80) -> str:
     """Format tool arguments for terminal display."""
-    result = str(args)
+    if isinstance(args, dict):
+        # Render the dict repr item by item and stop once over budget, so a
+        # large argument payload is never stringified in full
+        parts = []
+        size = -1  # Length of "{" + ", ".join(parts), updated incrementally
+        for key, value in args.items():
+            part = f"{key!r}: {value!r}"
+            parts.append(part)
+            size += len(part) + 2
+            if size > max_length:
+                break
+        result = "{" + ", ".join(parts)
+        if size <= max_length:
+            result += "}"
+    else:
+        result = str(args)
     if len(result) > max_length:
         return result[:max_length - 3] + "..."
     return result
 
+class ReportWriter:
+    """Write report sections to disk from a background thread.
+
+    Used as a context manager: entering starts the worker, exiting drains the
+    queue and waits for pending writes to land. Acts as a small write-back
+    cache: if a section is resubmitted before its previous body reached disk,
+    only the newest body is written.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="report-writer", daemon=True
+        )
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._queue.put(None)
+        self._thread.join()
+        return False
+
+    def submit(self, path: Path, text: str):
+        """Queue ``text`` to be written to ``path``."""
+        with self._lock:
+            already_queued = path in self._pending
+            self._pending[path] = text
+        if not already_queued:
+            self._queue.put(path)
+
+    def _run(self):
+        while True:
+            path = self._queue.get()
+            if path is None:
+                break
+            with self._lock:
+                text = self._pending.pop(path)
+            try:
+                _write_markdown(path, text)
+            except OSError as e:
+                console.print(f"[red]Error writing {path.name}: {e}[/red]")
+
+
+# Message/tool log buffering: file buffer size in bytes, lines per batch,
+# max seconds a batch may sit in memory, and stream flush cadence in chunks
+LOG_BUFFER_SIZE = 1 << 16
+LOG_BATCH_SIZE = 50
+LOG_FLUSH_INTERVAL = 0.1
+LOG_FLUSH_EVERY = 10
+# Keeps each logged message on a single line
+_LOG_NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+
+class MessageLog:
+    """Append-only message/tool log that writes lines in batches.
+
+    Lines are collected in memory and written with a single call once
+    LOG_BATCH_SIZE lines are pending or the oldest is LOG_FLUSH_INTERVAL
+    seconds old. Used as a context manager so the tail is flushed on exit.
+    """
+
+    def __init__(self, path: Path):
+        self._fh = open(path, "a", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
+        self._lines = []
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        self._fh.close()
+        return False
+
+    def write(self, line: str):
+        """Queue one log line (without trailing newline)."""
+        self._lines.append(line)
+        if (
+            len(self._lines) >= LOG_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write pending lines and flush the file buffer."""
+        if self._lines:
+            self._lines.append("")
+            self._fh.write("\n".join(self._lines))
+            self._lines.clear()
+        self._fh.flush()
+        self._last_flush = time.monotonic()
+
+
 def run_analysis():
     # First get all user selections
     selections = get_user_selections()
@@ -939,17 +1152,21 @@ def run_analysis():
     report_dir = results_dir / "reports"
     report_dir.mkdir(parents=True, exist_ok=True)
     log_file = results_dir / "message_tool.log"
-    log_file.touch(exist_ok=True)
+    # One batched log for the whole run instead of an open/close per event;
+    # it is flushed periodically while streaming and closed with the Live block
+    message_log = MessageLog(log_file)
+    # Report sections are written off the streaming thread
+    report_writer = ReportWriter()
 
     def save_message_decorator(obj, func_name):
         func = getattr(obj, func_name)
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            func(*args, **kwargs)
-            timestamp, message_type, content = obj.messages[-1]
-            content = content.replace("\n", " ")  # Replace newlines with spaces
-            with open(log_file, "a") as f:
-                f.write(f"{timestamp} [{message_type}] {content}\n")
+        def wrapper(message_type, content):
+            func(message_type, content)
+            # Log the full content; the buffer only keeps the truncated form
+            timestamp = obj.messages[-1][0]
+            content = str(content).translate(_LOG_NEWLINE_TABLE)  # Flatten to one line
+            message_log.write(f"{timestamp} [{message_type}] {content}")
         return wrapper
     
     def save_tool_call_decorator(obj, func_name):
@@ -957,10 +1174,9 @@ def run_analysis():
         @wraps(func)
         def wrapper(*args, **kwargs):
             func(*args, **kwargs)
-            timestamp, tool_name, args = obj.tool_calls[-1]
+            timestamp, tool_name, args, _ = obj.tool_calls[-1]
             args_str = ", ".join(f"{k}={v}" for k, v in args.items())
-            with open(log_file, "a") as f:
-                f.write(f"{timestamp} [Tool Call] {tool_name}({args_str})\n")
+            message_log.write(f"{timestamp} [Tool Call] {tool_name}({args_str})")
         return wrapper
 
     def save_report_section_decorator(obj, func_name):
@@ -970,10 +1186,11 @@ def run_analysis():
             func(section_name, content)
             if section_name in obj.report_sections and obj.report_sections[section_name] is not None:
                 content = obj.report_sections[section_name]
-                if content:
+                content_hash = hash(content)
+                if content and obj._report_hashes.get(section_name) != content_hash:
+                    obj._report_hashes[section_name] = content_hash
                     file_name = f"{section_name}.md"
-                    with open(report_dir / file_name, "w") as f:
-                        f.write(content)
+                    report_writer.submit(report_dir / file_name, content)
         return wrapper
 
     message_buffer.add_message = save_message_decorator(message_buffer, "add_message")
@@ -983,10 +1200,7 @@ def run_analysis():
     # Now start the display layout
     layout = create_layout()
 
-    with Live(layout, refresh_per_second=4) as live:
-        # Initial display
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
-
+    with message_log, report_writer, Live(layout, refresh_per_second=4) as live:
         # Add initial messages
         message_buffer.add_message("System", f"Selected ticker: {selections['ticker']}")
         message_buffer.add_message(
@@ -996,18 +1210,19 @@ def run_analysis():
             "System",
             f"Selected analysts: {', '.join(analyst.value for analyst in selections['analysts'])}",
         )
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
 
         # Update agent status to in_progress for the first analyst
         first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
         message_buffer.update_agent_status(first_analyst, "in_progress")
-        update_display(layout, stats_handler=stats_handler, start_time=start_time)
 
         # Create spinner text
         spinner_text = (
             f"Analyzing {selections['ticker']} on {selections['analysis_date']}..."
         )
+
+        # Render the initial state once and push it out immediately
         update_display(layout, spinner_text, stats_handler=stats_handler, start_time=start_time)
+        live.refresh()
 
         # Initialize state and get graph args with callbacks
         init_agent_state = graph.propagator.create_initial_state(
@@ -1020,6 +1235,7 @@ def run_analysis():
         # Stream the analysis
         trace = []
         for chunk in graph.graph.stream(init_agent_state, **args):
+            agent_status = message_buffer.agent_status
             # Process messages if present (skip duplicates via message ID)
             if len(chunk["messages"]) > 0:
                 last_message = chunk["messages"][-1]
@@ -1049,9 +1265,10 @@ def run_analysis():
             # Research Team - Handle Investment Debate State
             if chunk.get("investment_debate_state"):
                 debate_state = chunk["investment_debate_state"]
-                bull_hist = debate_state.get("bull_history", "").strip()
-                bear_hist = debate_state.get("bear_history", "").strip()
-                judge = debate_state.get("judge_decision", "").strip()
+                changed = message_buffer.changed_history
+                bull_hist = changed("bull_history", debate_state.get("bull_history", ""))
+                bear_hist = changed("bear_history", debate_state.get("bear_history", ""))
+                judge = changed("research_judge", debate_state.get("judge_decision", ""))
 
                 # Only update status when there's actual content
                 if bull_hist or bear_hist:
@@ -1076,38 +1293,39 @@ def run_analysis():
                 message_buffer.update_report_section(
                     "trader_investment_plan", chunk["trader_investment_plan"]
                 )
-                if message_buffer.agent_status.get("Trader") != "completed":
+                if agent_status.get("Trader") != "completed":
                     message_buffer.update_agent_status("Trader", "completed")
                     message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
 
             # Risk Management Team - Handle Risk Debate State
             if chunk.get("risk_debate_state"):
                 risk_state = chunk["risk_debate_state"]
-                agg_hist = risk_state.get("aggressive_history", "").strip()
-                con_hist = risk_state.get("conservative_history", "").strip()
-                neu_hist = risk_state.get("neutral_history", "").strip()
-                judge = risk_state.get("judge_decision", "").strip()
+                changed = message_buffer.changed_history
+                agg_hist = changed("aggressive_history", risk_state.get("aggressive_history", ""))
+                con_hist = changed("conservative_history", risk_state.get("conservative_history", ""))
+                neu_hist = changed("neutral_history", risk_state.get("neutral_history", ""))
+                judge = changed("risk_judge", risk_state.get("judge_decision", ""))
 
                 if agg_hist:
-                    if message_buffer.agent_status.get("Aggressive Analyst") != "completed":
+                    if agent_status.get("Aggressive Analyst") != "completed":
                         message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
                     message_buffer.update_report_section(
                         "final_trade_decision", f"### Aggressive Analyst Analysis\n{agg_hist}"
                     )
                 if con_hist:
-                    if message_buffer.agent_status.get("Conservative Analyst") != "completed":
+                    if agent_status.get("Conservative Analyst") != "completed":
                         message_buffer.update_agent_status("Conservative Analyst", "in_progress")
                     message_buffer.update_report_section(
                         "final_trade_decision", f"### Conservative Analyst Analysis\n{con_hist}"
                     )
                 if neu_hist:
-                    if message_buffer.agent_status.get("Neutral Analyst") != "completed":
+                    if agent_status.get("Neutral Analyst") != "completed":
                         message_buffer.update_agent_status("Neutral Analyst", "in_progress")
                     message_buffer.update_report_section(
                         "final_trade_decision", f"### Neutral Analyst Analysis\n{neu_hist}"
                     )
                 if judge:
-                    if message_buffer.agent_status.get("Portfolio Manager") != "completed":
+                    if agent_status.get("Portfolio Manager") != "completed":
                         message_buffer.update_agent_status("Portfolio Manager", "in_progress")
                         message_buffer.update_report_section(
                             "final_trade_decision", f"### Portfolio Manager Decision\n{judge}"
@@ -1121,14 +1339,15 @@ def run_analysis():
             update_display(layout, stats_handler=stats_handler, start_time=start_time)
 
             trace.append(chunk)
+            if len(trace) % LOG_FLUSH_EVERY == 0:
+                message_log.flush()
 
         # Get final state and decision
         final_state = trace[-1]
         decision = graph.process_signal(final_state["final_trade_decision"])
 
         # Update all agent statuses to completed
-        for agent in message_buffer.agent_status:
-            message_buffer.update_agent_status(agent, "completed")
+        message_buffer.bulk_set_status("completed")
 
         message_buffer.add_message(
             "System", f"Completed analysis for {selections['analysis_date']}"
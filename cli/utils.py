@@ -1,4 +1,5 @@
-import questionary
+import datetime
+import re
 from typing import List, Optional, Tuple, Dict
 
 from cli.models import AnalystType
@@ -10,9 +11,116 @@ ANALYST_ORDER = [
     ("Fundamentals Analyst", AnalystType.FUNDAMENTALS),
 ]
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Research depth options: (display label, debate/discussion rounds)
+_DEPTH_OPTIONS = (
+    ("Shallow - Quick research, few debate and strategy discussion rounds", 1),
+    ("Medium - Middle ground, moderate debate rounds and strategy discussion", 3),
+    ("Deep - Comprehensive research, in depth debate and strategy discussion", 5),
+)
+
+# Quick-thinking LLM options per provider: (display label, model name)
+_SHALLOW_AGENT_OPTIONS = {
+    "openai": (
+        ("GPT-5 Mini - Cost-optimized reasoning", "gpt-5-mini"),
+        ("GPT-5 Nano - Ultra-fast, high-throughput", "gpt-5-nano"),
+        ("GPT-5.2 - Latest flagship", "gpt-5.2"),
+        ("GPT-5.1 - Flexible reasoning", "gpt-5.1"),
+        ("GPT-4.1 - Smartest non-reasoning, 1M context", "gpt-4.1"),
+    ),
+    "anthropic": (
+        ("Claude Haiku 4.5 - Fast + extended thinking", "claude-haiku-4-5"),
+        ("Claude Sonnet 4.5 - Best for agents/coding", "claude-sonnet-4-5"),
+        ("Claude Sonnet 4 - High-performance", "claude-sonnet-4-20250514"),
+    ),
+    "google": (
+        ("Gemini 3.1 Pro Preview - New generation", "gemini-3.1-pro-preview"),
+        ("Gemini 3 Flash - Next-gen fast", "gemini-3-flash-preview"),
+        ("Gemini 2.5 Flash - Balanced, recommended", "gemini-2.5-flash"),
+        ("Gemini 3 Pro - Reasoning-first", "gemini-3-pro-preview"),
+        ("Gemini 2.5 Flash Lite - Fast, low-cost", "gemini-2.5-flash-lite"),
+    ),
+    "xai": (
+        ("Grok 4.1 Fast (Non-Reasoning) - Speed optimized, 2M ctx", "grok-4-1-fast-non-reasoning"),
+        ("Grok 4 Fast (Non-Reasoning) - Speed optimized", "grok-4-fast-non-reasoning"),
+        ("Grok 4.1 Fast (Reasoning) - High-performance, 2M ctx", "grok-4-1-fast-reasoning"),
+        ("Grok 4 Fast (Reasoning) - High-performance", "grok-4-fast-reasoning"),
+    ),
+    "openrouter": (
+        ("NVIDIA Nemotron 3 Nano 30B (free)", "nvidia/nemotron-3-nano-30b-a3b:free"),
+        ("Z.AI GLM 4.5 Air (free)", "z-ai/glm-4.5-air:free"),
+    ),
+    "ollama": (
+        ("Qwen3:latest (8B, local)", "qwen3:latest"),
+        ("GPT-OSS:latest (20B, local)", "gpt-oss:latest"),
+        ("GLM-4.7-Flash:latest (30B, local)", "glm-4.7-flash:latest"),
+    ),
+}
+
+# Deep-thinking LLM options per provider: (display label, model name)
+_DEEP_AGENT_OPTIONS = {
+    "openai": (
+        ("GPT-5.2 - Latest flagship", "gpt-5.2"),
+        ("GPT-5.1 - Flexible reasoning", "gpt-5.1"),
+        ("GPT-5 - Advanced reasoning", "gpt-5"),
+        ("GPT-4.1 - Smartest non-reasoning, 1M context", "gpt-4.1"),
+        ("GPT-5 Mini - Cost-optimized reasoning", "gpt-5-mini"),
+        ("GPT-5 Nano - Ultra-fast, high-throughput", "gpt-5-nano"),
+    ),
+    "anthropic": (
+        ("Claude Sonnet 4.5 - Best for agents/coding", "claude-sonnet-4-5"),
+        ("Claude Opus 4.5 - Premium, max intelligence", "claude-opus-4-5"),
+        ("Claude Opus 4.1 - Most capable model", "claude-opus-4-1-20250805"),
+        ("Claude Haiku 4.5 - Fast + extended thinking", "claude-haiku-4-5"),
+        ("Claude Sonnet 4 - High-performance", "claude-sonnet-4-20250514"),
+    ),
+    "google": (
+        ("Gemini 3.1 Pro Preview - New generation", "gemini-3.1-pro-preview"),
+        ("Gemini 3 Pro - Reasoning-first", "gemini-3-pro-preview"),
+        ("Gemini 3 Flash - Next-gen fast", "gemini-3-flash-preview"),
+        ("Gemini 2.5 Flash - Balanced, recommended", "gemini-2.5-flash"),
+    ),
+    "xai": (
+        ("Grok 4.1 Fast (Reasoning) - High-performance, 2M ctx", "grok-4-1-fast-reasoning"),
+        ("Grok 4 Fast (Reasoning) - High-performance", "grok-4-fast-reasoning"),
+        ("Grok 4 - Flagship model", "grok-4-0709"),
+        ("Grok 4.1 Fast (Non-Reasoning) - Speed optimized, 2M ctx", "grok-4-1-fast-non-reasoning"),
+        ("Grok 4 Fast (Non-Reasoning) - Speed optimized", "grok-4-fast-non-reasoning"),
+    ),
+    "openrouter": (
+        ("Z.AI GLM 4.5 Air (free)", "z-ai/glm-4.5-air:free"),
+        ("NVIDIA Nemotron 3 Nano 30B (free)", "nvidia/nemotron-3-nano-30b-a3b:free"),
+    ),
+    "ollama": (
+        ("GLM-4.7-Flash:latest (30B, local)", "glm-4.7-flash:latest"),
+        ("GPT-OSS:latest (20B, local)", "gpt-oss:latest"),
+        ("Qwen3:latest (8B, local)", "qwen3:latest"),
+    ),
+}
+
+# LLM provider options: (display name, API base URL)
+_BASE_URLS = (
+    ("OpenAI", "https://api.openai.com/v1"),
+    ("Google", "https://generativelanguage.googleapis.com/v1"),
+    ("Anthropic", "https://api.anthropic.com/"),
+    ("xAI", "https://api.x.ai/v1"),
+    ("Openrouter", "https://openrouter.ai/api/v1"),
+    ("Ollama", "http://localhost:11434/v1"),
+)
+
+
+def _questionary():
+    """Import questionary on first use; it pulls in prompt_toolkit, which is
+    only needed once the CLI actually prompts."""
+    import questionary
+
+    return questionary
+
 
 def get_ticker() -> str:
     """Prompt the user to enter a ticker symbol."""
+    questionary = _questionary()
     ticker = questionary.text(
         "Enter the ticker symbol to analyze:",
         validate=lambda x: len(x.strip()) > 0 or "Please enter a valid ticker symbol.",
@@ -33,14 +141,13 @@ def get_ticker() -> str:
 
 def get_analysis_date() -> str:
     """Prompt the user to enter a date in YYYY-MM-DD format."""
-    import re
-    from datetime import datetime
+    questionary = _questionary()
 
     def validate_date(date_str: str) -> bool:
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+        if not _DATE_RE.match(date_str):
             return False
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
+            datetime.datetime.strptime(date_str, "%Y-%m-%d")
             return True
         except ValueError:
             return False
@@ -66,6 +173,7 @@ def get_analysis_date() -> str:
 
 def select_analysts() -> List[AnalystType]:
     """Select analysts using an interactive checkbox."""
+    questionary = _questionary()
     choices = questionary.checkbox(
         "Select Your [Analysts Team]:",
         choices=[
@@ -92,18 +200,12 @@ def select_analysts() -> List[AnalystType]:
 
 def select_research_depth() -> int:
     """Select research depth using an interactive selection."""
-
-    # Define research depth options with their corresponding values
-    DEPTH_OPTIONS = [
-        ("Shallow - Quick research, few debate and strategy discussion rounds", 1),
-        ("Medium - Middle ground, moderate debate rounds and strategy discussion", 3),
-        ("Deep - Comprehensive research, in depth debate and strategy discussion", 5),
-    ]
+    questionary = _questionary()
 
     choice = questionary.select(
         "Select Your [Research Depth]:",
         choices=[
-            questionary.Choice(display, value=value) for display, value in DEPTH_OPTIONS
+            questionary.Choice(display, value=value) for display, value in _DEPTH_OPTIONS
         ],
         instruction="\n- Use arrow keys to navigate\n- Press Enter to select",
         style=questionary.Style(
@@ -124,50 +226,13 @@ def select_research_depth() -> int:
 
 def select_shallow_thinking_agent(provider) -> str:
     """Select shallow thinking llm engine using an interactive selection."""
-
-    # Define shallow thinking llm engine options with their corresponding model names
-    SHALLOW_AGENT_OPTIONS = {
-        "openai": [
-            ("GPT-5 Mini - Cost-optimized reasoning", "gpt-5-mini"),
-            ("GPT-5 Nano - Ultra-fast, high-throughput", "gpt-5-nano"),
-            ("GPT-5.2 - Latest flagship", "gpt-5.2"),
-            ("GPT-5.1 - Flexible reasoning", "gpt-5.1"),
-            ("GPT-4.1 - Smartest non-reasoning, 1M context", "gpt-4.1"),
-        ],
-        "anthropic": [
-            ("Claude Haiku 4.5 - Fast + extended thinking", "claude-haiku-4-5"),
-            ("Claude Sonnet 4.5 - Best for agents/coding", "claude-sonnet-4-5"),
-            ("Claude Sonnet 4 - High-performance", "claude-sonnet-4-20250514"),
-        ],
-        "google": [
-            ("Gemini 3.1 Pro Preview - New generation", "gemini-3.1-pro-preview"),
-            ("Gemini 3 Flash - Next-gen fast", "gemini-3-flash-preview"),
-            ("Gemini 2.5 Flash - Balanced, recommended", "gemini-2.5-flash"),
-            ("Gemini 3 Pro - Reasoning-first", "gemini-3-pro-preview"),
-            ("Gemini 2.5 Flash Lite - Fast, low-cost", "gemini-2.5-flash-lite"),
-        ],
-        "xai": [
-            ("Grok 4.1 Fast (Non-Reasoning) - Speed optimized, 2M ctx", "grok-4-1-fast-non-reasoning"),
-            ("Grok 4 Fast (Non-Reasoning) - Speed optimized", "grok-4-fast-non-reasoning"),
-            ("Grok 4.1 Fast (Reasoning) - High-performance, 2M ctx", "grok-4-1-fast-reasoning"),
-            ("Grok 4 Fast (Reasoning) - High-performance", "grok-4-fast-reasoning"),
-        ],
-        "openrouter": [
-            ("NVIDIA Nemotron 3 Nano 30B (free)", "nvidia/nemotron-3-nano-30b-a3b:free"),
-            ("Z.AI GLM 4.5 Air (free)", "z-ai/glm-4.5-air:free"),
-        ],
-        "ollama": [
-            ("Qwen3:latest (8B, local)", "qwen3:latest"),
-            ("GPT-OSS:latest (20B, local)", "gpt-oss:latest"),
-            ("GLM-4.7-Flash:latest (30B, local)", "glm-4.7-flash:latest"),
-        ],
-    }
+    questionary = _questionary()
 
     choice = questionary.select(
         "Select Your [Quick-Thinking LLM Engine]:",
         choices=[
             questionary.Choice(display, value=value)
-            for display, value in SHALLOW_AGENT_OPTIONS[provider.lower()]
+            for display, value in _SHALLOW_AGENT_OPTIONS[provider.lower()]
         ],
         instruction="\n- Use arrow keys to navigate\n- Press Enter to select",
         style=questionary.Style(
@@ -190,53 +255,13 @@ def select_shallow_thinking_agent(provider) -> str:
 
 def select_deep_thinking_agent(provider) -> str:
     """Select deep thinking llm engine using an interactive selection."""
-
-    # Define deep thinking llm engine options with their corresponding model names
-    DEEP_AGENT_OPTIONS = {
-        "openai": [
-            ("GPT-5.2 - Latest flagship", "gpt-5.2"),
-            ("GPT-5.1 - Flexible reasoning", "gpt-5.1"),
-            ("GPT-5 - Advanced reasoning", "gpt-5"),
-            ("GPT-4.1 - Smartest non-reasoning, 1M context", "gpt-4.1"),
-            ("GPT-5 Mini - Cost-optimized reasoning", "gpt-5-mini"),
-            ("GPT-5 Nano - Ultra-fast, high-throughput", "gpt-5-nano"),
-        ],
-        "anthropic": [
-            ("Claude Sonnet 4.5 - Best for agents/coding", "claude-sonnet-4-5"),
-            ("Claude Opus 4.5 - Premium, max intelligence", "claude-opus-4-5"),
-            ("Claude Opus 4.1 - Most capable model", "claude-opus-4-1-20250805"),
-            ("Claude Haiku 4.5 - Fast + extended thinking", "claude-haiku-4-5"),
-            ("Claude Sonnet 4 - High-performance", "claude-sonnet-4-20250514"),
-        ],
-        "google": [
-            ("Gemini 3.1 Pro Preview - New generation", "gemini-3.1-pro-preview"),
-            ("Gemini 3 Pro - Reasoning-first", "gemini-3-pro-preview"),
-            ("Gemini 3 Flash - Next-gen fast", "gemini-3-flash-preview"),
-            ("Gemini 2.5 Flash - Balanced, recommended", "gemini-2.5-flash"),
-        ],
-        "xai": [
-            ("Grok 4.1 Fast (Reasoning) - High-performance, 2M ctx", "grok-4-1-fast-reasoning"),
-            ("Grok 4 Fast (Reasoning) - High-performance", "grok-4-fast-reasoning"),
-            ("Grok 4 - Flagship model", "grok-4-0709"),
-            ("Grok 4.1 Fast (Non-Reasoning) - Speed optimized, 2M ctx", "grok-4-1-fast-non-reasoning"),
-            ("Grok 4 Fast (Non-Reasoning) - Speed optimized", "grok-4-fast-non-reasoning"),
-        ],
-        "openrouter": [
-            ("Z.AI GLM 4.5 Air (free)", "z-ai/glm-4.5-air:free"),
-            ("NVIDIA Nemotron 3 Nano 30B (free)", "nvidia/nemotron-3-nano-30b-a3b:free"),
-        ],
-        "ollama": [
-            ("GLM-4.7-Flash:latest (30B, local)", "glm-4.7-flash:latest"),
-            ("GPT-OSS:latest (20B, local)", "gpt-oss:latest"),
-            ("Qwen3:latest (8B, local)", "qwen3:latest"),
-        ],
-    }
+    questionary = _questionary()
 
     choice = questionary.select(
         "Select Your [Deep-Thinking LLM Engine]:",
         choices=[
             questionary.Choice(display, value=value)
-            for display, value in DEEP_AGENT_OPTIONS[provider.lower()]
+            for display, value in _DEEP_AGENT_OPTIONS[provider.lower()]
         ],
         instruction="\n- Use arrow keys to navigate\n- Press Enter to select",
         style=questionary.Style(
@@ -256,21 +281,13 @@ def select_deep_thinking_agent(provider) -> str:
 
 def select_llm_provider() -> tuple[str, str]:
     """Select the OpenAI api url using interactive selection."""
-    # Define OpenAI api options with their corresponding endpoints
-    BASE_URLS = [
-        ("OpenAI", "https://api.openai.com/v1"),
-        ("Google", "https://generativelanguage.googleapis.com/v1"),
-        ("Anthropic", "https://api.anthropic.com/"),
-        ("xAI", "https://api.x.ai/v1"),
-        ("Openrouter", "https://openrouter.ai/api/v1"),
-        ("Ollama", "http://localhost:11434/v1"),
-    ]
+    questionary = _questionary()
     
     choice = questionary.select(
         "Select your LLM Provider:",
         choices=[
             questionary.Choice(display, value=(display, value))
-            for display, value in BASE_URLS
+            for display, value in _BASE_URLS
         ],
         instruction="\n- Use arrow keys to navigate\n- Press Enter to select",
         style=questionary.Style(
@@ -294,6 +311,7 @@ def select_llm_provider() -> tuple[str, str]:
 
 def ask_openai_reasoning_effort() -> str:
     """Ask for OpenAI reasoning effort level."""
+    questionary = _questionary()
     choices = [
         questionary.Choice("Medium (Default)", "medium"),
         questionary.Choice("High (More thorough)", "high"),
@@ -316,6 +334,7 @@ def ask_gemini_thinking_config() -> str | None:
     Returns thinking_level: "high" or "minimal".
     Client maps to appropriate API param based on model series.
     """
+    questionary = _questionary()
     return questionary.select(
         "Select Thinking Mode:",
         choices=[
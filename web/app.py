@@ -1,21 +1,33 @@
-import copy
+import asyncio
+import gzip
+import hashlib
 import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import yfinance as yf
 
 from alphanexus.graph.trading_graph import AlphaNexusGraph
 from alphanexus.default_config import DEFAULT_CONFIG
+from alphanexus.dataflows.config import set_config
 from alphanexus.dataflows.errors import (
     DataflowAuthError,
     DataflowBadRequestError,
@@ -23,7 +35,7 @@ from alphanexus.dataflows.errors import (
 )
 from alphanexus.dataflows.alpha_vantage_common import _make_api_request
 from alphanexus.knowledge import get_company_graph_store
-from web.portfolio_service import build_portfolio_timeseries
+from web.portfolio_service import CACHE_FRESH_SECONDS, build_portfolio_timeseries
 
 load_dotenv()
 
@@ -37,8 +49,53 @@ def _read_text_or_default(path: Path, default: str = "") -> str:
         return default
 
 
-INDEX_HTML = _read_text_or_default(APP_DIR / "index.html")
-PORTFOLIO_HTML = _read_text_or_default(APP_DIR / "portfolio.html")
+@lru_cache(maxsize=8)
+def _read_bytes_cached(path: Path, mtime_ns: int) -> bytes:
+    return path.read_bytes()
+
+
+@lru_cache(maxsize=8)
+def _gzip_bytes_cached(path: Path, mtime_ns: int) -> bytes:
+    return gzip.compress(_read_bytes_cached(path, mtime_ns), compresslevel=6)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring ``q=0``."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    if "gzip" in accepted:
+        return accepted["gzip"] > 0
+    return accepted.get("*", 0.0) > 0
+
+
+def _html_response(path: Path, request: Request) -> Response:
+    """Serve a page, re-reading (and re-gzipping) it only when its mtime changes."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return HTMLResponse(content=b"")
+    headers = {"Vary": "Accept-Encoding"}
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=_gzip_bytes_cached(path, mtime_ns), headers=headers)
+    return HTMLResponse(content=_read_bytes_cached(path, mtime_ns), headers=headers)
+
+
+INDEX_HTML_FILE = APP_DIR / "index.html"
+PORTFOLIO_HTML_FILE = APP_DIR / "portfolio.html"
 INTRO_LIQUIDETHER_JS = _read_text_or_default(APP_DIR / "intro_liquidether_module.js")
 INTRO_LIQUIDETHER_CSS = _read_text_or_default(APP_DIR / "intro_liquidether.css")
 INTRO_LIGHTPILLAR_JS = _read_text_or_default(APP_DIR / "intro_components" / "LightPillar.module.js")
@@ -48,7 +105,53 @@ ANTINERTIA_INDEX_FILE = ANTINERTIA_DIST_DIR / "index.html"
 ANTINERTIA_ASSETS_DIR = ANTINERTIA_DIST_DIR / "assets"
 ANTINERTIA_VITE_SVG = ANTINERTIA_DIST_DIR / "vite.svg"
 
-app = FastAPI(title="AlphaNexus Web")
+# Graph runs take minutes, so they get their own small pool and can't starve
+# portfolio requests (or anything else on the shared anyio threadpool).
+GRAPH_WORKERS = int(os.getenv("GRAPH_WORKERS", "2"))
+PORTFOLIO_WORKERS = 8
+_GRAPH_POOL = ThreadPoolExecutor(max_workers=GRAPH_WORKERS, thread_name_prefix="graph")
+_PORTFOLIO_POOL = ThreadPoolExecutor(max_workers=PORTFOLIO_WORKERS, thread_name_prefix="portfolio")
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    _GRAPH_POOL.shutdown(wait=False, cancel_futures=True)
+    _PORTFOLIO_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded by orjson; the /api payloads carry full reports."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed by orjson.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI still
+    turns malformed bodies into a 422.
+    """
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
+app = FastAPI(title="AlphaNexus Web", lifespan=_lifespan, default_response_class=ORJSONResponse)
+app.router.route_class = ORJSONRoute
 
 if ANTINERTIA_ASSETS_DIR.exists():
     app.mount("/assets", StaticFiles(directory=str(ANTINERTIA_ASSETS_DIR)), name="frontend-assets")
@@ -199,18 +302,19 @@ MARKET_PREVIEW_RANGE_CONFIG: dict[str, dict[str, str]] = {
     "all": {"period": "max", "interval": "1mo"},
 }
 
-_SYMBOL_BY_NAME: dict[str, str] = {
-    name.lower(): symbol for symbol, name in POPULAR_US_STOCKS.items()
-}
-_SYMBOL_BY_NAME.update(
-    {name.lower().replace(" corporation", ""): symbol for symbol, name in POPULAR_US_STOCKS.items()}
-)
-_SYMBOL_BY_NAME.update(
-    {name.lower().replace(" inc.", "").replace(", inc.", ""): symbol for symbol, name in POPULAR_US_STOCKS.items()}
-)
-_SYMBOL_BY_NAME.update(
-    {name.lower(): symbol for symbol, name in POPULAR_US_STOCKS_ZH.items()}
-)
+
+def _iter_symbol_aliases():
+    # Full names plus the " corporation"/" inc." stripped forms, then Chinese names
+    for symbol, name in POPULAR_US_STOCKS.items():
+        lower = name.lower()
+        yield lower, symbol
+        yield lower.replace(" corporation", ""), symbol
+        yield lower.replace(" inc.", "").replace(", inc.", ""), symbol
+    for symbol, name in POPULAR_US_STOCKS_ZH.items():
+        yield name.lower(), symbol
+
+
+_SYMBOL_BY_NAME: dict[str, str] = dict(_iter_symbol_aliases())
 _SYMBOL_BY_NAME.update(
     {
         "nvidia": "NVDA",
@@ -233,31 +337,39 @@ _SYMBOL_BY_NAME.update(
 )
 
 
+_POPULAR_TICKERS = frozenset(POPULAR_US_STOCKS)
+
+# Accept values like "Apple Inc. (AAPL)" or "AAPL - Apple Inc."
+_TICKER_PAREN_RE = re.compile(r"\(([A-Z][A-Z0-9\.\-]{0,9})\)")
+_TICKER_LEAD_RE = re.compile(r"^([A-Z][A-Z0-9\.\-]{0,9})\s*[-|]")
+
+
 def _normalize_ticker_input(raw: str) -> str:
     value = (raw or "").strip()
     if not value:
         raise HTTPException(status_code=400, detail="股票代码不能为空")
 
     upper = value.upper()
-    if upper in POPULAR_US_STOCKS:
+    if upper in _POPULAR_TICKERS:
         return upper
 
-    # Accept values like "Apple Inc. (AAPL)" or "AAPL - Apple Inc."
-    match = re.search(r"\(([A-Z][A-Z0-9\.\-]{0,9})\)", upper)
-    if match:
-        symbol = match.group(1)
-        if symbol in POPULAR_US_STOCKS:
-            return symbol
+    # Both patterns need a bracket or separator, so plain words can skip them
+    if not (upper.isascii() and upper.isalnum()):
+        match = _TICKER_PAREN_RE.search(upper)
+        if match:
+            symbol = match.group(1)
+            if symbol in _POPULAR_TICKERS:
+                return symbol
 
-    match = re.match(r"^([A-Z][A-Z0-9\.\-]{0,9})\s*[-|]", upper)
-    if match:
-        symbol = match.group(1)
-        if symbol in POPULAR_US_STOCKS:
-            return symbol
+        match = _TICKER_LEAD_RE.match(upper)
+        if match:
+            symbol = match.group(1)
+            if symbol in _POPULAR_TICKERS:
+                return symbol
 
-    lower = value.lower()
-    if lower in _SYMBOL_BY_NAME:
-        return _SYMBOL_BY_NAME[lower]
+    symbol = _SYMBOL_BY_NAME.get(value.lower())
+    if symbol is not None:
+        return symbol
 
     # Fallback: keep original symbol-style input and let upstream validate.
     return upper
@@ -636,8 +748,10 @@ def _build_market_preview(symbol: str, range_key: str) -> dict:
 
 
 class RunRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     ticker: str = Field(..., min_length=1)
-    trade_date: str
+    trade_date: date
     risk_profile: str | None = None
     provider: str | None = None
     api_key: str | None = None
@@ -647,14 +761,16 @@ class RunRequest(BaseModel):
     quick_think_llm: str | None = None
     selected_analysts: list[str] | None = None
     debate_mode: str | None = None
-    min_debate_rounds: int | None = None
-    max_debate_rounds: int | None = None
-    min_risk_discuss_rounds: int | None = None
-    max_risk_discuss_rounds: int | None = None
+    min_debate_rounds: int | None = Field(default=None, ge=2)
+    max_debate_rounds: int | None = Field(default=None, ge=2)
+    min_risk_discuss_rounds: int | None = Field(default=None, ge=2)
+    max_risk_discuss_rounds: int | None = Field(default=None, ge=2)
     config_overrides: dict | None = None
 
 
 class PortfolioRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     symbols: list[str] | None = None
     allocation: dict[str, float] | None = None
     total_value: float = Field(default=200000.0, gt=0)
@@ -679,6 +795,62 @@ def _normalize_risk_profile(raw: str | None) -> str:
     )
 
 
+_ALLOWED_PROVIDERS = frozenset(
+    {"openai", "anthropic", "google", "xai", "openrouter", "ollama", "deepseek"}
+)
+
+# Provider -> (deep_think_llm, quick_think_llm) used when the request doesn't pick models
+_DEFAULT_MODELS: dict[str, tuple[str, str]] = {
+    "openai": ("gpt-5.2", "gpt-5-mini"),
+    "anthropic": ("claude-sonnet-4-5", "claude-haiku-4-5"),
+    "google": ("gemini-2.5-pro", "gemini-2.5-flash"),
+    "xai": ("grok-4", "grok-4-1-fast"),
+    "openrouter": ("openai/gpt-5.2", "openai/gpt-5-mini"),
+    "ollama": ("llama3.1:8b", "llama3.1:8b"),
+    "deepseek": ("deepseek-reasoner", "deepseek-chat"),
+}
+
+# Provider -> server-side environment variable holding its API key
+_ENV_KEYS: dict[str, str] = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "xai": "XAI_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+}
+
+
+def _build_config_template(provider: str) -> MappingProxyType:
+    template = dict(DEFAULT_CONFIG)
+    template["llm_provider"] = provider
+    template["deep_think_llm"], template["quick_think_llm"] = _DEFAULT_MODELS[provider]
+    # The web UI only consumes finished reports, so analysts can run side by side
+    template["parallel_analysts"] = True
+    return MappingProxyType(template)
+
+
+# Read-only per-provider starting configs; requests copy one and overlay their fields
+_CONFIG_TEMPLATES: dict[str, MappingProxyType] = {
+    provider: _build_config_template(provider) for provider in _ALLOWED_PROVIDERS
+}
+
+# The only nested dicts in DEFAULT_CONFIG; everything else is a primitive
+_NESTED_CONFIG_KEYS = ("data_vendors", "tool_vendors")
+
+
+def _fresh_config(provider: str) -> dict:
+    """Copy a provider template without deepcopy.
+
+    A shallow copy covers the primitives; the known nested dicts get their own
+    copies so a request can never mutate DEFAULT_CONFIG through them.
+    """
+    config = dict(_CONFIG_TEMPLATES[provider])
+    for key in _NESTED_CONFIG_KEYS:
+        config[key] = dict(config.get(key) or {})
+    return config
+
+
 def _prepare_config(payload: RunRequest):
     def _coerce_positive_int(value, field_name: str, min_value: int = 1):
         if value is None:
@@ -691,43 +863,16 @@ def _prepare_config(payload: RunRequest):
             raise HTTPException(status_code=400, detail=f"{field_name} 必须 >= {min_value}")
         return v
 
-    try:
-        date.fromisoformat(payload.trade_date)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail="trade_date 格式应为 YYYY-MM-DD") from exc
-
     selected = payload.selected_analysts or ["market", "social", "news", "fundamentals"]
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    if payload.config_overrides:
-        config.update(payload.config_overrides)
-
-    provider = (
-        payload.provider
-        or (payload.config_overrides or {}).get("llm_provider")
-        or "deepseek"
-    ).lower()
-    allowed_providers = {"openai", "anthropic", "google", "xai", "openrouter", "ollama", "deepseek"}
-    if provider not in allowed_providers:
+    overrides = payload.config_overrides or {}
+    provider = (payload.provider or overrides.get("llm_provider") or "deepseek").lower()
+    if provider not in _ALLOWED_PROVIDERS:
         raise HTTPException(status_code=400, detail="不支持的 LLM 供应商")
 
-    config["llm_provider"] = provider
-
-    # Use provider defaults if no model override in config_overrides
-    if not payload.config_overrides or (
-        "deep_think_llm" not in payload.config_overrides
-        and "quick_think_llm" not in payload.config_overrides
-    ):
-        default_models = {
-            "openai": ("gpt-5.2", "gpt-5-mini"),
-            "anthropic": ("claude-sonnet-4-5", "claude-haiku-4-5"),
-            "google": ("gemini-2.5-pro", "gemini-2.5-flash"),
-            "xai": ("grok-4", "grok-4-1-fast"),
-            "openrouter": ("openai/gpt-5.2", "openai/gpt-5-mini"),
-            "ollama": ("llama3.1:8b", "llama3.1:8b"),
-            "deepseek": ("deepseek-reasoner", "deepseek-chat"),
-        }
-        if provider in default_models:
-            config["deep_think_llm"], config["quick_think_llm"] = default_models[provider]
+    config = _fresh_config(provider)
+    if overrides:
+        config.update(overrides)
+        config["llm_provider"] = provider
 
     if payload.deep_think_llm:
         config["deep_think_llm"] = payload.deep_think_llm
@@ -739,27 +884,16 @@ def _prepare_config(payload: RunRequest):
         raise HTTPException(status_code=400, detail="debate_mode 仅支持 adaptive/fixed")
     config["debate_mode"] = debate_mode
 
-    min_debate_rounds = _coerce_positive_int(
-        payload.min_debate_rounds, "min_debate_rounds", 2
-    )
-    max_debate_rounds = _coerce_positive_int(
-        payload.max_debate_rounds, "max_debate_rounds", 2
-    )
-    min_risk_rounds = _coerce_positive_int(
-        payload.min_risk_discuss_rounds, "min_risk_discuss_rounds", 2
-    )
-    max_risk_rounds = _coerce_positive_int(
-        payload.max_risk_discuss_rounds, "max_risk_discuss_rounds", 2
-    )
-
-    if min_debate_rounds is not None:
-        config["min_debate_rounds"] = min_debate_rounds
-    if max_debate_rounds is not None:
-        config["max_debate_rounds"] = max_debate_rounds
-    if min_risk_rounds is not None:
-        config["min_risk_discuss_rounds"] = min_risk_rounds
-    if max_risk_rounds is not None:
-        config["max_risk_discuss_rounds"] = max_risk_rounds
+    # Request fields are range-checked by RunRequest; values that come from
+    # config_overrides are still coerced below.
+    if payload.min_debate_rounds is not None:
+        config["min_debate_rounds"] = payload.min_debate_rounds
+    if payload.max_debate_rounds is not None:
+        config["max_debate_rounds"] = payload.max_debate_rounds
+    if payload.min_risk_discuss_rounds is not None:
+        config["min_risk_discuss_rounds"] = payload.min_risk_discuss_rounds
+    if payload.max_risk_discuss_rounds is not None:
+        config["max_risk_discuss_rounds"] = payload.max_risk_discuss_rounds
 
     min_debate_cfg = config.get("min_debate_rounds")
     if min_debate_cfg is None:
@@ -801,15 +935,7 @@ def _prepare_config(payload: RunRequest):
     api_key = (payload.api_key or "").strip() if payload.api_key else ""
     llm_key_source = "n/a"
     if provider != "ollama":
-        env_keys = {
-            "openai": "OPENAI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "google": "GOOGLE_API_KEY",
-            "xai": "XAI_API_KEY",
-            "openrouter": "OPENROUTER_API_KEY",
-            "deepseek": "DEEPSEEK_API_KEY",
-        }
-        env_var = env_keys.get(provider)
+        env_var = _ENV_KEYS.get(provider)
         fallback_key = (os.environ.get(env_var, "") if env_var else "").strip()
 
         # Priority: request key > server env key.
@@ -867,23 +993,34 @@ def _prepare_config(payload: RunRequest):
     return config, selected, meta
 
 
-_URL_RE = re.compile(r"https?://[^\s\]\)\"'>]+")
+# A URL runs to whitespace or a closing bracket/quote, and never ends in
+# trailing punctuation (. , ;) from the surrounding sentence.
+_URL_RE = re.compile(r"https?://[^\s\])\"'>]*[^\s\])\"'>.,;]")
 
 
-def _extract_sources(texts: list[str]) -> list[str]:
-    urls: list[str] = []
-    seen = set()
-    for text in texts:
-        if not text:
-            continue
-        for raw in _URL_RE.findall(text):
-            url = raw.rstrip(").,;]")
-            if url not in seen:
-                seen.add(url)
-                urls.append(url)
-    return urls
+# State fields scanned for cited URLs, in the order sources are listed
+_SOURCE_KEYS = (
+    "final_trade_decision",
+    "investment_plan",
+    "trader_investment_plan",
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "news_report_ui",
+    "fundamentals_report",
+)
 
 
+def _extract_sources(state: dict, keys: tuple[str, ...] = _SOURCE_KEYS) -> list[str]:
+    # One regex sweep over all texts; URLs never span the newline separator.
+    # dict.fromkeys keeps first-seen order while dropping duplicates.
+    buf = "\n".join(text for text in map(state.get, keys) if text)
+    return list(dict.fromkeys(_URL_RE.findall(buf)))
+
+
+# The graph store is loaded once per process and never changes, so snapshots
+# don't go stale; callers share the cached dict and must not mutate it.
+@lru_cache(maxsize=256)
 def _company_graph_payload(ticker: str) -> dict:
     store = get_company_graph_store()
     snap = store.get_impact_snapshot(ticker, max_hops=2, max_edges=24)
@@ -897,85 +1034,178 @@ def _company_graph_payload(ticker: str) -> dict:
     }
 
 
-def _debate_payload(final_state: dict) -> dict:
-    investment_state = final_state.get("investment_debate_state") or {}
-    risk_state = final_state.get("risk_debate_state") or {}
+@lru_cache(maxsize=256)
+def _company_graph_body(ticker: str) -> tuple[bytes, str]:
+    """Encoded /api/company-graph response for ``ticker`` and its weak ETag."""
+    body = orjson.dumps({"ok": True, "data": _company_graph_payload(ticker)})
+    return body, f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _debate_payload(investment_state: dict, risk_state: dict) -> dict:
+    invest_get = investment_state.get
+    risk_get = risk_state.get
     return {
         "investment_debate_state": {
-            "history": investment_state.get("history", ""),
-            "bull_history": investment_state.get("bull_history", ""),
-            "bear_history": investment_state.get("bear_history", ""),
-            "judge_decision": investment_state.get("judge_decision", ""),
-            "count": investment_state.get("count", 0),
+            "history": invest_get("history", ""),
+            "bull_history": invest_get("bull_history", ""),
+            "bear_history": invest_get("bear_history", ""),
+            "judge_decision": invest_get("judge_decision", ""),
+            "count": invest_get("count", 0),
         },
         "risk_debate_state": {
-            "history": risk_state.get("history", ""),
-            "aggressive_history": risk_state.get("aggressive_history", ""),
-            "conservative_history": risk_state.get("conservative_history", ""),
-            "neutral_history": risk_state.get("neutral_history", ""),
-            "judge_decision": risk_state.get("judge_decision", ""),
-            "count": risk_state.get("count", 0),
+            "history": risk_get("history", ""),
+            "aggressive_history": risk_get("aggressive_history", ""),
+            "conservative_history": risk_get("conservative_history", ""),
+            "neutral_history": risk_get("neutral_history", ""),
+            "judge_decision": risk_get("judge_decision", ""),
+            "count": risk_get("count", 0),
         },
     }
 
 
 def _build_response(final_state: dict, decision: str, meta: dict) -> dict:
-    ticker = final_state.get("company_of_interest")
-    reports = {
-        "market_report": final_state.get("market_report"),
-        "sentiment_report": final_state.get("sentiment_report"),
-        "news_report": final_state.get("news_report"),
-        "news_report_ui": final_state.get("news_report_ui"),
-        "fundamentals_report": final_state.get("fundamentals_report"),
-    }
-    sources = _extract_sources(
-        [
-            final_state.get("final_trade_decision", ""),
-            final_state.get("investment_plan", ""),
-            final_state.get("trader_investment_plan", ""),
-            reports.get("market_report", ""),
-            reports.get("sentiment_report", ""),
-            reports.get("news_report", ""),
-            reports.get("news_report_ui", ""),
-            reports.get("fundamentals_report", ""),
-        ]
-    )
+    get = final_state.get
+    ticker = get("company_of_interest")
+    final_trade_decision = get("final_trade_decision")
+    investment_plan = get("investment_plan")
+    trader_investment_plan = get("trader_investment_plan")
+    market_report = get("market_report")
+    sentiment_report = get("sentiment_report")
+    news_report = get("news_report")
+    news_report_ui = get("news_report_ui")
+    fundamentals_report = get("fundamentals_report")
+    sources = _extract_sources(final_state)
 
     return {
         "ticker": ticker,
-        "trade_date": final_state.get("trade_date"),
+        "trade_date": get("trade_date"),
         "decision": decision,
-        "final_trade_decision": final_state.get("final_trade_decision"),
-        "investment_plan": final_state.get("investment_plan"),
-        "trader_investment_plan": final_state.get("trader_investment_plan"),
-        "reports": reports,
+        "final_trade_decision": final_trade_decision,
+        "investment_plan": investment_plan,
+        "trader_investment_plan": trader_investment_plan,
+        "reports": {
+            "market_report": market_report,
+            "sentiment_report": sentiment_report,
+            "news_report": news_report,
+            "news_report_ui": news_report_ui,
+            "fundamentals_report": fundamentals_report,
+        },
         "sources": sources,
         "company_graph": _company_graph_payload(ticker or ""),
-        **_debate_payload(final_state),
+        **_debate_payload(
+            get("investment_debate_state") or {},
+            get("risk_debate_state") or {},
+        ),
         "meta": meta,
     }
 
 
+# Idle AlphaNexusGraph instances by a digest of (analysts, config). A graph
+# keeps per-run state (ticker, logged states), so a run takes one exclusively
+# and hands it back only once it has finished cleanly.
+_GRAPH_CACHE_SIZE = 8
+_idle_graphs: "OrderedDict[str, list[AlphaNexusGraph]]" = OrderedDict()
+_idle_graphs_lock = threading.Lock()
+
+
+def _graph_key(selected: list[str], config: dict) -> str:
+    body = orjson.dumps([selected, config], option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _acquire_graph(selected: list[str], config: dict) -> AlphaNexusGraph:
+    """Take an idle graph built for this config, or build a new one."""
+    with _idle_graphs_lock:
+        idle = _idle_graphs.get(_graph_key(selected, config))
+        graph = idle.pop() if idle else None
+
+    if graph is None:
+        return AlphaNexusGraph(
+            selected_analysts=selected,
+            debug=False,
+            config=config,
+        )
+    # Building another request's graph may have replaced the global dataflow config
+    set_config(graph.config)
+    graph.log_states_dict.clear()
+    return graph
+
+
+def _release_graph(selected: list[str], config: dict, graph: AlphaNexusGraph) -> None:
+    key = _graph_key(selected, config)
+    with _idle_graphs_lock:
+        idle = _idle_graphs.setdefault(key, [])
+        _idle_graphs.move_to_end(key)
+        if len(idle) < GRAPH_WORKERS:
+            idle.append(graph)
+        if len(_idle_graphs) > _GRAPH_CACHE_SIZE:
+            _idle_graphs.popitem(last=False)
+
+
 def _run_graph(payload: RunRequest) -> dict:
     config, selected, meta = _prepare_config(payload)
     ticker = _normalize_ticker_input(payload.ticker)
     risk_profile = meta.get("risk_profile", "balanced")
 
-    graph = AlphaNexusGraph(
-        selected_analysts=selected,
-        debug=False,
-        config=config,
-    )
-
+    graph = _acquire_graph(selected, config)
     final_state, decision = graph.propagate(
         ticker,
-        payload.trade_date,
+        payload.trade_date.isoformat(),
         risk_profile=risk_profile,
     )
+    _release_graph(selected, config, graph)
 
     return _build_response(final_state, decision, meta)
 
 
+# Finished /api/run responses, keyed by a digest of the full request body
+_RUN_CACHE_TTL = 3600.0
+_RUN_CACHE_SIZE = 256
+_run_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+# Runs in progress, so identical concurrent requests share one graph run
+_run_inflight: dict[str, asyncio.Future] = {}
+
+
+def _run_cache_key(payload: RunRequest) -> str:
+    body = orjson.dumps(payload.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+async def _run_graph_cached(payload: RunRequest) -> dict:
+    key = _run_cache_key(payload)
+    cached = _run_cache.get(key)
+    if cached is not None:
+        expires_at, result = cached
+        if expires_at > time.monotonic():
+            _run_cache.move_to_end(key)
+            return result
+        del _run_cache[key]
+
+    task = _run_inflight.get(key)
+    if task is None:
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(
+            loop.run_in_executor(_GRAPH_POOL, _run_graph, payload)
+        )
+        _run_inflight[key] = task
+
+        def _on_done(done: asyncio.Future) -> None:
+            _run_inflight.pop(key, None)
+            if done.cancelled():
+                return
+            if done.exception() is not None:
+                # Retrieved here so an error nobody awaited is not logged
+                return
+            _run_cache[key] = (time.monotonic() + _RUN_CACHE_TTL, done.result())
+            if len(_run_cache) > _RUN_CACHE_SIZE:
+                _run_cache.popitem(last=False)
+
+        task.add_done_callback(_on_done)
+
+    # Shielded so a cancelled caller (the first included) leaves the run going
+    return await asyncio.shield(task)
+
+
 def _portfolio_error_payload(exc: Exception) -> dict:
     if isinstance(exc, DataflowError):
         return {
@@ -992,13 +1222,14 @@ def _portfolio_error_payload(exc: Exception) -> dict:
     }
 
 
-def _run_portfolio(payload: PortfolioRequest) -> dict:
+def _run_portfolio(payload: PortfolioRequest, live: bool = False) -> dict:
     try:
         return build_portfolio_timeseries(
             symbols=payload.symbols,
             allocation=payload.allocation,
             total_value=payload.total_value,
             api_key=(payload.alpha_vantage_key or "").strip() or None,
+            max_cache_age=0 if live else CACHE_FRESH_SECONDS,
         )
     except ValueError as exc:
         raise HTTPException(
@@ -1017,21 +1248,49 @@ def _run_portfolio(payload: PortfolioRequest) -> dict:
         raise HTTPException(status_code=500, detail=_portfolio_error_payload(exc)) from exc
 
 
-def _sse_event(payload: dict, event: str | None = None) -> str:
-    message = ""
+def _sse_event(payload: dict, event: str | None = None) -> bytes:
+    # orjson emits UTF-8 bytes directly, which Starlette writes without re-encoding
+    frame = b"data: " + orjson.dumps(payload) + b"\n\n"
     if event:
-        message += f"event: {event}\n"
-    message += f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
-    return message
+        return b"event: " + event.encode() + b"\n" + frame
+    return frame
 
 
-def _stream_graph(payload: RunRequest):
+@lru_cache(maxsize=64)
+def _progress_event(percent: int, stage: str) -> bytes:
+    # Progress frames come from a small fixed set of (percent, stage) pairs
+    return _sse_event({"type": "progress", "percent": percent, "stage": stage})
+
+
+# Reports streamed as they appear; news_report_ui's label is filled in with the
+# run's risk profile label.
+_STREAM_REPORT_LABELS: tuple[tuple[str, str], ...] = (
+    ("market_report", "市场分析"),
+    ("sentiment_report", "社媒情绪"),
+    ("news_report", "新闻宏观"),
+    ("news_report_ui", "新闻宏观（投资风格：{risk_profile_label}）"),
+    ("fundamentals_report", "基本面"),
+)
+
+# (state key, label, progress percent, progress stage) for each summary
+_STREAM_SUMMARY_LABELS: tuple[tuple[str, str, int, str], ...] = (
+    ("investment_plan", "投资计划", 70, "投资计划已生成"),
+    ("trader_investment_plan", "交易员计划", 78, "交易员计划已生成"),
+    ("final_trade_decision", "最终交易结论", 93, "最终结论已生成"),
+)
+
+# Keep proxies (nginx honours X-Accel-Buffering) and browsers from holding events back
+_SSE_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+
+# Marks the end of _iter_graph_events output on the _stream_graph queue
+_STREAM_DONE = object()
+
+
+def _iter_graph_events(payload: RunRequest, ticker: str, config: dict, selected: list[str], meta: dict):
     try:
-        config, selected, meta = _prepare_config(payload)
-        ticker = _normalize_ticker_input(payload.ticker)
         yield _sse_event({"type": "status", "message": "初始化完成，开始分析..."})
         yield _sse_event({"type": "meta", "meta": meta})
-        yield _sse_event({"type": "progress", "percent": 5, "stage": "初始化完成"})
+        yield _progress_event(5, "初始化完成")
 
         progress_sent = 5
 
@@ -1040,87 +1299,74 @@ def _stream_graph(payload: RunRequest):
             if percent <= progress_sent:
                 return None
             progress_sent = percent
-            return _sse_event({"type": "progress", "percent": percent, "stage": stage})
+            return _progress_event(percent, stage)
 
-        graph = AlphaNexusGraph(
-            selected_analysts=selected,
-            debug=False,
-            config=config,
-        )
+        graph = _acquire_graph(selected, config)
         event = maybe_progress(12, "图执行已启动")
         if event:
             yield event
 
         init_state = graph.propagator.create_initial_state(
             ticker,
-            payload.trade_date,
+            payload.trade_date.isoformat(),
             risk_profile=meta.get("risk_profile", "balanced"),
         )
         args = graph.propagator.get_graph_args()
 
         last_state = None
         seen = {}
-        report_labels = {
-            "market_report": "市场分析",
-            "sentiment_report": "社媒情绪",
-            "news_report": "新闻宏观",
-            "news_report_ui": f"新闻宏观（投资风格：{meta.get('risk_profile_label', '适中')}）",
-            "fundamentals_report": "基本面",
-        }
+        risk_profile_label = meta.get("risk_profile_label", "适中")
+        report_labels = tuple(
+            (key, label.format(risk_profile_label=risk_profile_label))
+            for key, label in _STREAM_REPORT_LABELS
+        )
         chunk_count = 0
+        seen_get = seen.get
+        sse = _sse_event
 
         for chunk in graph.graph.stream(init_state, **args):
             last_state = chunk
+            chunk_get = chunk.get
+            # Frames produced for one chunk go out as a single write
+            parts: list[bytes] = []
+            emit = parts.append
             chunk_count += 1
             event = maybe_progress(min(55, 12 + chunk_count * 2), "分析节点执行中")
             if event:
-                yield event
+                emit(event)
 
-            for key, label in report_labels.items():
-                value = chunk.get(key)
-                if value and value != seen.get(key):
+            for key, label in report_labels:
+                value = chunk_get(key)
+                if value and value != seen_get(key):
                     seen[key] = value
-                    yield _sse_event(
+                    emit(sse(
                         {
                             "type": "report",
                             "report_type": key,
                             "label": label,
                             "content": value,
                         }
-                    )
+                    ))
                     event = maybe_progress(60, f"{label} 已完成")
                     if event:
-                        yield event
-
-            for key, label in (
-                ("investment_plan", "投资计划"),
-                ("trader_investment_plan", "交易员计划"),
-                ("final_trade_decision", "最终交易结论"),
-            ):
-                value = chunk.get(key)
-                if value and value != seen.get(key):
+                        emit(event)
+
+            for key, label, percent, stage in _STREAM_SUMMARY_LABELS:
+                value = chunk_get(key)
+                if value and value != seen_get(key):
                     seen[key] = value
-                    yield _sse_event(
+                    emit(sse(
                         {"type": "summary", "summary_type": key, "label": label, "content": value}
-                    )
-                    if key == "investment_plan":
-                        event = maybe_progress(70, "投资计划已生成")
-                        if event:
-                            yield event
-                    elif key == "trader_investment_plan":
-                        event = maybe_progress(78, "交易员计划已生成")
-                        if event:
-                            yield event
-                    elif key == "final_trade_decision":
-                        event = maybe_progress(93, "最终结论已生成")
-                        if event:
-                            yield event
-
-            investment_state = chunk.get("investment_debate_state") or {}
+                    ))
+                    event = maybe_progress(percent, stage)
+                    if event:
+                        emit(event)
+
+            investment_state = chunk_get("investment_debate_state") or {}
             investment_history = investment_state.get("history", "")
-            if investment_history and investment_history != seen.get("investment_debate_history"):
+            if investment_history and investment_history != seen_get("investment_debate_history"):
                 seen["investment_debate_history"] = investment_history
-                yield _sse_event(
+                emit(sse(
                     {
                         "type": "debate",
                         "debate_type": "investment_debate_state",
@@ -1129,16 +1375,16 @@ def _stream_graph(payload: RunRequest):
                         "judge_decision": investment_state.get("judge_decision", ""),
                         "count": investment_state.get("count", 0),
                     }
-                )
+                ))
                 event = maybe_progress(84, "投资辩论阶段完成")
                 if event:
-                    yield event
+                    emit(event)
 
-            risk_state = chunk.get("risk_debate_state") or {}
+            risk_state = chunk_get("risk_debate_state") or {}
             risk_history = risk_state.get("history", "")
-            if risk_history and risk_history != seen.get("risk_debate_history"):
+            if risk_history and risk_history != seen_get("risk_debate_history"):
                 seen["risk_debate_history"] = risk_history
-                yield _sse_event(
+                emit(sse(
                     {
                         "type": "debate",
                         "debate_type": "risk_debate_state",
@@ -1147,15 +1393,19 @@ def _stream_graph(payload: RunRequest):
                         "judge_decision": risk_state.get("judge_decision", ""),
                         "count": risk_state.get("count", 0),
                     }
-                )
+                ))
                 event = maybe_progress(90, "风控辩论阶段完成")
                 if event:
-                    yield event
+                    emit(event)
+
+            if parts:
+                yield b"".join(parts)
 
         if last_state is None:
             raise RuntimeError("未产生任何输出")
 
         decision = graph.process_signal(last_state.get("final_trade_decision", ""))
+        _release_graph(selected, config, graph)
         event = maybe_progress(97, "正在整理最终输出")
         if event:
             yield event
@@ -1164,9 +1414,6 @@ def _stream_graph(payload: RunRequest):
         if event:
             yield event
         yield _sse_event({"type": "final", "data": final_payload})
-    except HTTPException as exc:
-        detail = exc.detail if isinstance(exc.detail, str) else json.dumps(exc.detail, ensure_ascii=False)
-        yield _sse_event({"type": "error", "message": detail, "retryable": exc.status_code >= 500})
     except Exception as exc:
         message = str(exc).strip() or exc.__class__.__name__
         lower = message.lower()
@@ -1175,22 +1422,63 @@ def _stream_graph(payload: RunRequest):
         yield _sse_event({"type": "error", "message": message, "retryable": True})
 
 
+async def _stream_graph(payload: RunRequest, ticker: str, config: dict, selected: list[str], meta: dict):
+    """Relay the SSE frames of ``_iter_graph_events`` from a worker thread.
+
+    The graph run blocks, so the synchronous generator is drained on the
+    graph pool and hands frames over through an ``asyncio.Queue``; Starlette then
+    iterates this async generator directly instead of offloading every chunk
+    to its threadpool.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def pump() -> None:
+        events = _iter_graph_events(payload, ticker, config, selected, meta)
+        try:
+            for frame in events:
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, frame)
+        finally:
+            events.close()
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_DONE)
+
+    producer = loop.run_in_executor(_GRAPH_POOL, pump)
+    try:
+        # SSE comment, ignored by clients: gets headers out before the graph starts
+        yield b": ping\n\n"
+        while (frame := await queue.get()) is not _STREAM_DONE:
+            yield frame
+        await producer
+    finally:
+        # Client went away: let the worker stop at the next frame
+        stop.set()
+
+
+# Constant responses; Starlette doesn't mutate a Response when sending it
+_FAVICON_RESPONSE = Response(status_code=204)
+_HEALTH_RESPONSE = ORJSONResponse({"status": "ok"})
+_PORTFOLIO_HEALTH_RESPONSE = ORJSONResponse({"status": "ok", "service": "portfolio"})
+
+
 @app.get("/", response_class=HTMLResponse)
-def index() -> HTMLResponse:
+def index(request: Request) -> Response:
     if ANTINERTIA_INDEX_FILE.exists():
-        return HTMLResponse(content=ANTINERTIA_INDEX_FILE.read_text(encoding="utf-8"))
-    return HTMLResponse(content=INDEX_HTML)
+        return _html_response(ANTINERTIA_INDEX_FILE, request)
+    return _html_response(INDEX_HTML_FILE, request)
 
 
 @app.get("/console", response_class=HTMLResponse)
-def console_page() -> HTMLResponse:
-    return HTMLResponse(content=INDEX_HTML)
+def console_page(request: Request) -> Response:
+    return _html_response(INDEX_HTML_FILE, request)
 
 
 @app.get("/favicon.ico", include_in_schema=False)
 def favicon() -> Response:
     # 浏览器会自动请求 favicon。此处返回 204，避免日志里出现无意义 404。
-    return Response(status_code=204)
+    return _FAVICON_RESPONSE
 
 
 @app.get("/vite.svg", include_in_schema=False)
@@ -1221,65 +1509,81 @@ def intro_lightpillar_css() -> Response:
 
 
 @app.get("/portfolio", response_class=HTMLResponse)
-def portfolio_page() -> HTMLResponse:
-    return HTMLResponse(content=PORTFOLIO_HTML)
+def portfolio_page(request: Request) -> Response:
+    return _html_response(PORTFOLIO_HTML_FILE, request)
 
 
 @app.post("/api/run")
-async def run(payload: RunRequest) -> JSONResponse:
-    result = await run_in_threadpool(_run_graph, payload)
-    return JSONResponse(content=result)
+async def run(payload: RunRequest) -> ORJSONResponse:
+    result = await _run_graph_cached(payload)
+    return ORJSONResponse(result)
 
 
 @app.post("/api/run/stream")
 async def run_stream(payload: RunRequest) -> StreamingResponse:
-    return StreamingResponse(_stream_graph(payload), media_type="text/event-stream")
+    # Validate before the stream starts so bad input gets a real 4xx status
+    config, selected, meta = _prepare_config(payload)
+    ticker = _normalize_ticker_input(payload.ticker)
+    return StreamingResponse(
+        _stream_graph(payload, ticker, config, selected, meta),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
 
 
 @app.get("/api/health")
-def health() -> dict:
-    return {"status": "ok"}
+def health() -> ORJSONResponse:
+    return _HEALTH_RESPONSE
 
 
 @app.get("/api/market/preview")
 async def market_preview(
     ticker: str = Query(..., min_length=1),
     range_key: str = Query("1y", alias="range"),
-) -> JSONResponse:
+) -> ORJSONResponse:
     symbol = _normalize_ticker_input(ticker)
     payload = await run_in_threadpool(_build_market_preview, symbol, range_key)
-    return JSONResponse(content={"ok": True, "data": payload})
+    return ORJSONResponse({"ok": True, "data": payload})
 
 
 @app.get("/api/company-graph/{ticker}")
-def company_graph(ticker: str) -> JSONResponse:
-    payload = _company_graph_payload(_normalize_ticker_input(ticker))
-    return JSONResponse(content={"ok": True, "data": payload})
+def company_graph(ticker: str, request: Request) -> Response:
+    body, etag = _company_graph_body(_normalize_ticker_input(ticker))
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/portfolio/health")
-def portfolio_health() -> dict:
-    return {"status": "ok", "service": "portfolio"}
+def portfolio_health() -> ORJSONResponse:
+    return _PORTFOLIO_HEALTH_RESPONSE
 
 
 @app.get("/api/portfolio/data")
-async def portfolio_data_get() -> JSONResponse:
+async def portfolio_data_get() -> ORJSONResponse:
     payload = PortfolioRequest()
-    result = await run_in_threadpool(_run_portfolio, payload)
-    return JSONResponse(content={"ok": True, "data": result})
+    result = await asyncio.get_running_loop().run_in_executor(
+        _PORTFOLIO_POOL, _run_portfolio, payload
+    )
+    return ORJSONResponse({"ok": True, "data": result})
 
 
 @app.post("/api/portfolio/data")
-async def portfolio_data_post(payload: PortfolioRequest) -> JSONResponse:
-    result = await run_in_threadpool(_run_portfolio, payload)
-    return JSONResponse(content={"ok": True, "data": result})
+async def portfolio_data_post(payload: PortfolioRequest) -> ORJSONResponse:
+    result = await asyncio.get_running_loop().run_in_executor(
+        _PORTFOLIO_POOL, _run_portfolio, payload
+    )
+    return ORJSONResponse({"ok": True, "data": result})
 
 
 @app.post("/api/portfolio/refresh")
-async def portfolio_refresh(payload: PortfolioRequest) -> JSONResponse:
-    # Current service always attempts live MCP first, then falls back to cache.
-    result = await run_in_threadpool(_run_portfolio, payload)
-    return JSONResponse(content={"ok": True, "data": result})
+async def portfolio_refresh(payload: PortfolioRequest) -> ORJSONResponse:
+    # Always attempts live MCP first (skipping the fresh-cache shortcut), then falls back to cache.
+    result = await asyncio.get_running_loop().run_in_executor(
+        _PORTFOLIO_POOL, _run_portfolio, payload, True
+    )
+    return ORJSONResponse({"ok": True, "data": result})
 
 
 if __name__ == "__main__":
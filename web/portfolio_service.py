@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
 import time
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
 from alphanexus.dataflows.alpha_vantage_mcp import fetch_time_series_daily_mcp
 from alphanexus.dataflows.errors import DataflowRateLimitError
 
@@ -22,11 +26,24 @@ PORTFOLIO_CACHE_DIR = PROJECT_ROOT / "results" / "portfolio_cache"
 MIN_AV_REQUEST_INTERVAL_SECONDS = float(
     os.getenv("PORTFOLIO_AV_MIN_INTERVAL_SECONDS", "1.5")
 )
+# Cache files younger than this are served without calling the vendor at all.
+CACHE_FRESH_SECONDS = float(os.getenv("PORTFOLIO_CACHE_FRESH_SECONDS", "900"))
 
 _AV_CALL_LOCK = threading.Lock()
 _LAST_AV_CALL_MONOTONIC = 0.0
 
+# Recent vendor payloads by (symbol, outputsize), reused for a short while
+# after a call returns.
+FETCH_MEMO_TTL_SECONDS = 60.0
+_FETCH_MEMO_SIZE = 64
+_fetch_memo: "OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]]" = OrderedDict()
+# Vendor calls in progress by the same key; concurrent requests for a symbol
+# wait on the one call instead of each queueing at the rate-limit gate.
+_fetch_inflight: dict[tuple[str, str], Future] = {}
+_fetch_memo_lock = threading.Lock()
 
+
+@lru_cache(maxsize=256)
 def _cache_path(symbol: str) -> Path:
     safe = symbol.upper().replace("/", "_")
     return PORTFOLIO_CACHE_DIR / f"{safe}.json"
@@ -35,10 +52,15 @@ def _cache_path(symbol: str) -> Path:
 def _write_cache(symbol: str, payload: dict[str, Any]) -> None:
     PORTFOLIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     data = {
-        "saved_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "saved_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "payload": payload,
     }
-    _cache_path(symbol).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    # Write a per-thread temp file and rename it over the cache, so readers
+    # never see a half-written file and concurrent writers don't collide.
+    path = _cache_path(symbol)
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(orjson.dumps(data))
+    os.replace(tmp, path)
 
 
 def _read_cache(symbol: str) -> dict[str, Any] | None:
@@ -46,8 +68,8 @@ def _read_cache(symbol: str) -> dict[str, Any] | None:
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        data = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
         return None
 
     payload = data.get("payload")
@@ -61,27 +83,76 @@ def _rate_limited_fetch(
     *,
     outputsize: str,
     api_key: str | None = None,
+    bypass_memo: bool = False,
 ) -> dict[str, Any]:
     global _LAST_AV_CALL_MONOTONIC
 
-    # Free tier is strict on burst; gate calls globally to avoid parallel hits.
-    with _AV_CALL_LOCK:
-        if MIN_AV_REQUEST_INTERVAL_SECONDS > 0:
-            now = time.monotonic()
-            wait_seconds = MIN_AV_REQUEST_INTERVAL_SECONDS - (
-                now - _LAST_AV_CALL_MONOTONIC
-            )
-            if wait_seconds > 0:
-                time.sleep(wait_seconds)
-        _LAST_AV_CALL_MONOTONIC = time.monotonic()
+    key = (symbol.upper(), outputsize)
+    with _fetch_memo_lock:
+        memo = None if bypass_memo else _fetch_memo.get(key)
+        if memo is not None and time.monotonic() - memo[0] < FETCH_MEMO_TTL_SECONDS:
+            _fetch_memo.move_to_end(key)
+            return memo[1]
+        inflight = _fetch_inflight.get(key)
+        if inflight is None:
+            call = _fetch_inflight[key] = Future()
+    if inflight is not None:
+        # A call for this key is already live; its result is as fresh as ours
+        return inflight.result()
 
-    return fetch_time_series_daily_mcp(symbol, outputsize=outputsize, api_key=api_key)
+    try:
+        # Free tier is strict on burst; gate calls globally to avoid parallel hits.
+        with _AV_CALL_LOCK:
+            if MIN_AV_REQUEST_INTERVAL_SECONDS > 0:
+                now = time.monotonic()
+                wait_seconds = MIN_AV_REQUEST_INTERVAL_SECONDS - (
+                    now - _LAST_AV_CALL_MONOTONIC
+                )
+                if wait_seconds > 0:
+                    time.sleep(wait_seconds)
+            _LAST_AV_CALL_MONOTONIC = time.monotonic()
+
+        payload = fetch_time_series_daily_mcp(symbol, outputsize=outputsize, api_key=api_key)
+    except BaseException as exc:
+        with _fetch_memo_lock:
+            del _fetch_inflight[key]
+        call.set_exception(exc)
+        raise
 
+    with _fetch_memo_lock:
+        _fetch_memo[key] = (time.monotonic(), payload)
+        _fetch_memo.move_to_end(key)
+        if len(_fetch_memo) > _FETCH_MEMO_SIZE:
+            _fetch_memo.popitem(last=False)
+        del _fetch_inflight[key]
+    call.set_result(payload)
+    return payload
+
+
+def _load_symbol_series(
+    symbol: str,
+    api_key: str | None = None,
+    max_cache_age: float = CACHE_FRESH_SECONDS,
+) -> tuple[dict[str, Any], bool, str | None]:
+    if max_cache_age > 0:
+        try:
+            age = time.time() - _cache_path(symbol).stat().st_mtime
+        except FileNotFoundError:
+            age = None
+        if age is not None and age < max_cache_age:
+            cached = _read_cache(symbol)
+            if cached is not None:
+                return cached, True, None
 
-def _load_symbol_series(symbol: str, api_key: str | None = None) -> tuple[dict[str, Any], bool, str | None]:
     try:
         # Use compact only to stay within free-tier constraints (latest ~100 daily points).
-        payload = _rate_limited_fetch(symbol, outputsize="compact", api_key=api_key)
+        # A live refresh (max_cache_age <= 0) must not be answered from the memo
+        payload = _rate_limited_fetch(
+            symbol,
+            outputsize="compact",
+            api_key=api_key,
+            bypass_memo=max_cache_age <= 0,
+        )
         _write_cache(symbol, payload)
         return payload, False, None
     except DataflowRateLimitError as exc:
@@ -97,24 +168,59 @@ def _load_symbol_series(symbol: str, api_key: str | None = None) -> tuple[dict[s
 
 
 def _filter_recent(series: list[dict[str, Any]], max_points: int = DEFAULT_WINDOW_POINTS) -> list[dict[str, Any]]:
-    valid = [
+    # Walk from the newest row and stop once max_points valid rows are found
+    rows = reversed(series) if max_points > 0 else series
+    valid = (
         row
-        for row in series
+        for row in rows
         if isinstance(row, dict)
         and row.get("date")
         and row.get("close") is not None
-    ]
+    )
     if max_points <= 0:
-        return valid
-    return valid[-max_points:]
-
-
-def _normalize_inputs(
-    symbols: list[str] | None,
-    allocation: dict[str, float] | None,
+        return list(valid)
+    recent = list(islice(valid, max_points))
+    recent.reverse()
+    return recent
+
+
+def _intersect_sorted(date_lists: list[list[str]]) -> tuple[list[str], list[list[int]]]:
+    """Dates present in every list, in order, and each one's index in every list.
+
+    Each list must be sorted and free of duplicates.
+    """
+    first, *rest = date_lists
+    positions = [0] * len(rest)
+    common: list[str] = []
+    rows: list[list[int]] = [[] for _ in date_lists]
+    for first_row, day in enumerate(first):
+        matched = True
+        for i, dates in enumerate(rest):
+            j = positions[i]
+            end = len(dates)
+            while j < end and dates[j] < day:
+                j += 1
+            positions[i] = j
+            if j == end:
+                return common, rows
+            if dates[j] != day:
+                matched = False
+                break
+        if matched:
+            common.append(day)
+            rows[0].append(first_row)
+            for i, j in enumerate(positions):
+                rows[i + 1].append(j)
+    return common, rows
+
+
+@lru_cache(maxsize=64)
+def _normalize_cached(
+    symbols: tuple[str, ...] | None,
+    allocation: tuple[tuple[str, float], ...] | None,
     total_value: float,
-) -> tuple[list[str], dict[str, float], float]:
-    selected = [s.upper() for s in (symbols or DEFAULT_SYMBOLS)]
+) -> tuple[tuple[str, ...], tuple[tuple[str, float], ...], float]:
+    selected = tuple(s.upper() for s in (symbols or DEFAULT_SYMBOLS))
     if len(selected) != 3:
         raise ValueError("Portfolio tracker requires exactly 3 symbols.")
 
@@ -122,7 +228,7 @@ def _normalize_inputs(
         if not symbol.strip():
             raise ValueError("Invalid symbol in portfolio symbols.")
 
-    input_alloc = allocation or {k: DEFAULT_ALLOCATION.get(k, 0.0) for k in selected}
+    input_alloc = dict(allocation) if allocation else {k: DEFAULT_ALLOCATION.get(k, 0.0) for k in selected}
     weights = {}
     for symbol in selected:
         value = float(input_alloc.get(symbol, 0.0))
@@ -133,7 +239,7 @@ def _normalize_inputs(
     total_weight = sum(weights.values())
     if total_weight <= 0:
         raise ValueError("Allocation total must be > 0.")
-    weights = {k: v / total_weight for k, v in weights.items()}
+    weights = tuple((k, v / total_weight) for k, v in weights.items())
 
     if total_value <= 0:
         raise ValueError("total_value must be > 0")
@@ -141,12 +247,28 @@ def _normalize_inputs(
     return selected, weights, float(total_value)
 
 
+def _normalize_inputs(
+    symbols: list[str] | None,
+    allocation: dict[str, float] | None,
+    total_value: float,
+) -> tuple[list[str], dict[str, float], float]:
+    # Dashboard polling repeats the same inputs, so validate each combination once;
+    # the cache holds tuples and every caller gets its own list and dict.
+    selected, weights, total_value = _normalize_cached(
+        tuple(symbols) if symbols else None,
+        tuple(allocation.items()) if allocation else None,
+        total_value,
+    )
+    return list(selected), dict(weights), total_value
+
+
 def build_portfolio_timeseries(
     *,
     symbols: list[str] | None = None,
     allocation: dict[str, float] | None = None,
     total_value: float = DEFAULT_TOTAL_VALUE,
     api_key: str | None = None,
+    max_cache_age: float = CACHE_FRESH_SECONDS,
 ) -> dict[str, Any]:
     selected, weights, total_value = _normalize_inputs(symbols, allocation, total_value)
 
@@ -154,65 +276,86 @@ def build_portfolio_timeseries(
     cached_flags: dict[str, bool] = {}
     warnings: list[str] = []
 
+    # Fetch concurrently; _rate_limited_fetch still spaces out the vendor calls,
+    # but one symbol's round-trip no longer waits for the previous one.
+    with ThreadPoolExecutor(max_workers=len(selected), thread_name_prefix="portfolio-fetch") as pool:
+        futures = {
+            symbol: pool.submit(
+                _load_symbol_series, symbol, api_key=api_key, max_cache_age=max_cache_age
+            )
+            for symbol in selected
+        }
+
     for symbol in selected:
-        payload, is_cached, warning = _load_symbol_series(symbol, api_key=api_key)
+        payload, is_cached, warning = futures[symbol].result()
         series = _filter_recent(payload.get("series", []), DEFAULT_WINDOW_POINTS)
         if not series:
             raise RuntimeError(f"No recent price data for {symbol} in latest {DEFAULT_WINDOW_POINTS} points")
+        # Parallel date list / close array; rows matched across symbols are located by index
         symbol_data[symbol] = {
             "payload": payload,
-            "series": series,
-            "close_by_date": {row["date"]: row["close"] for row in series},
+            "dates": [row["date"] for row in series],
+            "closes": np.fromiter(
+                (row["close"] for row in series), dtype=np.float64, count=len(series)
+            ),
         }
         cached_flags[symbol] = is_cached
         if warning:
             warnings.append(warning)
 
-    common_dates = sorted(
-        set.intersection(*(set(v["close_by_date"].keys()) for v in symbol_data.values()))
-    )
+    # Series come back sorted by date, so a pointer walk yields the overlap in order
+    common_dates, rows = _intersect_sorted([v["dates"] for v in symbol_data.values()])
     if not common_dates:
         raise RuntimeError("No overlapping trading dates across selected symbols")
+    for data, symbol_rows in zip(symbol_data.values(), rows):
+        data["rows"] = symbol_rows
 
     latest_date = common_dates[-1]
     shares: dict[str, float] = {}
+    latest_closes: dict[str, float] = {}
     for symbol in selected:
-        latest_close = symbol_data[symbol]["close_by_date"][latest_date]
+        latest_close = float(symbol_data[symbol]["closes"][symbol_data[symbol]["rows"][-1]])
         if not latest_close or latest_close <= 0:
             raise RuntimeError(f"Invalid latest close for {symbol}: {latest_close}")
         shares[symbol] = (total_value * weights[symbol]) / latest_close
-
-    timeline: list[dict[str, Any]] = []
-    for day in common_dates:
-        stock_values: dict[str, float] = {}
-        total = 0.0
-        for symbol in selected:
-            close = symbol_data[symbol]["close_by_date"][day]
-            value = shares[symbol] * close
-            stock_values[symbol] = round(value, 2)
-            total += value
-
-        if total <= 0:
-            continue
-
-        stock_weights = {
-            symbol: round((stock_values[symbol] / total), 6) for symbol in selected
+        latest_closes[symbol] = latest_close
+
+    # One row per common date, one column per symbol
+    closes = np.column_stack(
+        [
+            symbol_data[symbol]["closes"][symbol_data[symbol]["rows"]]
+            for symbol in selected
+        ]
+    )
+    values = closes * np.array([shares[symbol] for symbol in selected])
+    totals = values.sum(axis=1)
+    keep = totals > 0
+    days = [day for day, kept in zip(common_dates, keep.tolist()) if kept]
+    values = np.round(values[keep], 2)
+    totals = totals[keep]
+    # Weights are taken from the rounded per-stock values, as displayed
+    weights_by_day = np.round(values / totals[:, None], 6)
+
+    timeline: list[dict[str, Any]] = [
+        {
+            "date": day,
+            "total_value": total,
+            "stock_values": dict(zip(selected, day_values)),
+            "stock_weights": dict(zip(selected, day_weights)),
         }
-        timeline.append(
-            {
-                "date": day,
-                "total_value": round(total, 2),
-                "stock_values": stock_values,
-                "stock_weights": stock_weights,
-            }
+        for day, total, day_values, day_weights in zip(
+            days,
+            np.round(totals, 2).tolist(),
+            values.tolist(),
+            weights_by_day.tolist(),
         )
+    ]
 
     if not timeline:
         raise RuntimeError("Portfolio timeline is empty after processing")
 
     symbol_meta = []
     for symbol in selected:
-        latest_close = symbol_data[symbol]["close_by_date"][latest_date]
         symbol_meta.append(
             {
                 "symbol": symbol,
@@ -221,7 +364,7 @@ def build_portfolio_timeseries(
                 "target_weight": round(weights[symbol], 6),
                 "target_amount": round(total_value * weights[symbol], 2),
                 "shares": round(shares[symbol], 6),
-                "latest_close": latest_close,
+                "latest_close": latest_closes[symbol],
                 "vendor": "alpha_vantage_mcp",
                 "last_refreshed": symbol_data[symbol]["payload"].get("last_refreshed"),
             }